@@ -0,0 +1,17 @@
+"""
+Benchmarks of estimagic_stargazer, in the format of asv (airspeed velocity).
+
+Run them with ``asv run`` (see ``asv.conf.json``) or without asv with
+``python -m benchmarks``. The generators in ``common`` create synthetic models
+of any size, so that the benchmarks do not depend on statsmodels.
+
+"""
+
+import sys
+from pathlib import Path
+
+# asv imports the benchmarks from an existing environment in which this
+# repository, which has no packaging setup, is not installed
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
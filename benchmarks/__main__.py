@@ -0,0 +1,65 @@
+"""
+Run the benchmarks without asv.
+
+Usage from the root of the repository: ``python -m benchmarks [pattern]``. Every
+``time_*`` and ``peakmem_*`` method of the benchmark classes whose name contains
+pattern is run. For ``time_*`` methods the best time of a few runs is printed,
+for ``peakmem_*`` methods the peak memory allocated while the method runs, as
+traced by tracemalloc. Unlike asv, this does not include the memory allocated
+by setup.
+
+"""
+
+import importlib
+import inspect
+import itertools
+import pkgutil
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+
+def run(pattern=""):
+    for module_info in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + module_info.name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, "params", [])
+            if params and not isinstance(params[0], list):
+                params = [params]
+            methods = [m for m in dir(cls) if m.startswith(("time_", "peakmem_"))]
+            for method in methods:
+                name = "{}.{}.{}".format(module_info.name, cls_name, method)
+                if pattern not in name:
+                    continue
+                for args in itertools.product(*params):
+                    bench = cls()
+                    if hasattr(bench, "setup"):
+                        bench.setup(*args)
+                    func = getattr(bench, method)
+                    if method.startswith("time_"):
+                        times = timeit.repeat(lambda: func(*args), number=1, repeat=3)
+                        result = "{:.6f} s".format(min(times))
+                    else:
+                        result = "{:.1f} MB".format(peak_memory(func, *args) / 1e6)
+                    if hasattr(bench, "teardown"):
+                        bench.teardown(*args)
+                    print("{}{}: {}".format(name, list(args), result))
+
+
+def peak_memory(func, *args):
+    """Return the peak memory in bytes allocated while func(*args) runs."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    run(*sys.argv[1:])
@@ -0,0 +1,49 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+from estimagic_stargazer.stargazer_function import Stargazer
+
+from .common import generate_models
+
+
+class TimeExtraction:
+    """Extract and align the data of many models with many parameters."""
+
+    params = [[1, 10, 50], [10, 1000, 10000], [1, 3]]
+    param_names = ["n_models", "n_params", "n_levels"]
+
+    def setup(self, n_models, n_params, n_levels):
+        self.models = generate_models(n_models, n_params, n_levels)
+        self.stargazer = Stargazer(self.models)
+
+    def time_extract_data(self, n_models, n_params, n_levels):
+        self.stargazer.extract_data()
+
+    def time_construct_slim(self, n_models, n_params, n_levels):
+        Stargazer(self.models, slim=True)
+
+    def peakmem_extract_data(self, n_models, n_params, n_levels):
+        self.stargazer.extract_data()
+
+
+class TimeExtractedStorage:
+    """Save and load the extracted data of a table instead of extracting it."""
+
+    params = [[1, 10, 50], [10, 1000, 10000]]
+    param_names = ["n_models", "n_params"]
+
+    def setup(self, n_models, n_params):
+        self.stargazer = Stargazer(generate_models(n_models, n_params))
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = Path(self.tmp_dir) / "extracted.npz"
+        self.stargazer.save_extracted(self.path)
+
+    def teardown(self, n_models, n_params):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_save_extracted(self, n_models, n_params):
+        self.stargazer.save_extracted(self.path)
+
+    def time_load_extracted(self, n_models, n_params):
+        Stargazer.load_extracted(self.path)
@@ -0,0 +1,93 @@
+import itertools
+import shutil
+import tempfile
+
+from estimagic_stargazer.cache import TableCache
+from estimagic_stargazer.layout import format_body
+from estimagic_stargazer.stargazer_function import Stargazer
+
+from .common import generate_models
+
+
+class TimeRendering:
+    """Render tables of many models with many parameters from scratch.
+
+    The render cache is cleared before every render, so that the timings
+    include building the layout.
+    """
+
+    params = [[1, 10, 50], [10, 1000, 10000], [1, 3]]
+    param_names = ["n_models", "n_params", "n_levels"]
+
+    def setup(self, n_models, n_params, n_levels):
+        self.stargazer = Stargazer(generate_models(n_models, n_params, n_levels))
+        self.sig_levels = itertools.cycle([[0.1, 0.05, 0.01], [0.2, 0.1, 0.05]])
+
+    def time_significance_levels(self, n_models, n_params, n_levels):
+        # new levels change the stars of every cell, which are computed when
+        # the body is formatted
+        self.stargazer.significance_levels(next(self.sig_levels))
+        format_body(self.stargazer, self.stargazer.table_layout(), slice(None))
+
+    def time_render_html(self, n_models, n_params, n_levels):
+        self.stargazer.clear_render_cache()
+        self.stargazer.render_html()
+
+    def time_render_latex(self, n_models, n_params, n_levels):
+        self.stargazer.clear_render_cache()
+        self.stargazer.render_latex()
+
+    def peakmem_render_html(self, n_models, n_params, n_levels):
+        self.stargazer.clear_render_cache()
+        self.stargazer.render_html()
+
+    def peakmem_render_latex(self, n_models, n_params, n_levels):
+        self.stargazer.clear_render_cache()
+        self.stargazer.render_latex()
+
+
+class TimeCachedRendering:
+    """Render a large table again after changing an option of its header.
+
+    Only the header is rendered again; the rendered body is cached.
+    """
+
+    params = [1000, 10000]
+    param_names = ["n_params"]
+
+    def setup(self, n_params):
+        self.stargazer = Stargazer(generate_models(10, n_params, n_levels=2))
+        self.stargazer.render_html()
+        self.stargazer.render_latex()
+        self.titles = itertools.cycle(["A", "B"])
+
+    def time_render_html_new_title(self, n_params):
+        self.stargazer.title(next(self.titles))
+        self.stargazer.render_html()
+
+    def time_render_latex_new_title(self, n_params):
+        self.stargazer.title(next(self.titles))
+        self.stargazer.render_latex()
+
+
+class TimeTableCache:
+    """Read unchanged tables from a TableCache instead of rendering them."""
+
+    params = [[1, 10], [10, 1000, 10000]]
+    param_names = ["n_models", "n_params"]
+
+    def setup(self, n_models, n_params):
+        self.models = generate_models(n_models, n_params)
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = TableCache(self.tmp_dir)
+        self.cache.render(self.models, {"title": "Table"}, "latex")
+
+    def teardown(self, n_models, n_params):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_cache_hit(self, n_models, n_params):
+        self.cache.render(self.models, {"title": "Table"}, "latex")
+
+    def time_cache_miss(self, n_models, n_params):
+        self.cache.clear()
+        self.cache.render(self.models, {"title": "Table"}, "latex")
@@ -0,0 +1,21 @@
+from estimagic_stargazer.stargazer_function import Stargazer
+
+from .common import generate_models
+
+
+class TimeTemplateRendering:
+    """Compare the Jinja2 template renderer with render_html."""
+
+    params = [10, 1000]
+    param_names = ["n_params"]
+
+    def setup(self, n_params):
+        self.stargazer = Stargazer(generate_models(3, n_params, n_levels=2))
+        # compile the template before timing
+        self.stargazer.render_html_template()
+
+    def time_render_html(self, n_params):
+        self.stargazer.render_html()
+
+    def time_render_html_template(self, n_params):
+        self.stargazer.render_html_template()
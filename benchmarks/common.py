@@ -0,0 +1,71 @@
+"""
+Synthetic regression results for the benchmarks.
+
+The models are dictionaries in the format accepted by Stargazer, so that the
+benchmarks do not depend on statsmodels.
+
+"""
+
+import string
+
+import numpy as np
+import pandas as pd
+
+
+def generate_param_index(n_params, n_levels=1):
+    """Create a parameter index with n_params entries and n_levels levels.
+
+    Outer levels group the parameters in blocks of ten, like estimagic params.
+    """
+    names = ["x{}".format(i) for i in range(n_params)]
+    if n_levels == 1:
+        return pd.Index(names)
+    arrays = []
+    for level in range(n_levels - 1, 0, -1):
+        block = np.arange(n_params) // 10**level
+        arrays.append([string.ascii_lowercase[level] + str(b) for b in block])
+    arrays.append(names)
+    return pd.MultiIndex.from_arrays(arrays)
+
+
+def generate_params_and_info(n_params, n_levels=1, seed=0):
+    """Create the params DataFrame and info dictionary of one model."""
+    rng = np.random.default_rng(seed)
+    value = rng.normal(size=n_params)
+    standard_error = rng.uniform(0.1, 1, size=n_params)
+    params = pd.DataFrame(
+        {
+            "value": value,
+            "pvalue": rng.uniform(0, 0.2, size=n_params),
+            "standard_error": standard_error,
+            "ci_lower": value - 1.96 * standard_error,
+            "ci_upper": value + 1.96 * standard_error,
+        },
+        index=generate_param_index(n_params, n_levels),
+    )
+    info = {
+        "rsquared": rng.uniform(),
+        "rsquared_adj": rng.uniform(),
+        "scale": rng.uniform(1, 2),
+        "fvalue": rng.uniform(10, 50),
+        "f_pvalue": rng.uniform(0, 0.1),
+        "df_model": float(n_params),
+        "df_resid": 10_000.0 - n_params - 1,
+        "dependent_variable": "y",
+        "n_obs": 10_000,
+    }
+    return {"params": params, "info": info}
+
+
+def generate_models(n_models, n_params, n_levels=1):
+    """Create n_models models whose parameters overlap only partially.
+
+    Model i has all but the last min(i, n_params // 2) parameters, so that the
+    parameter union has to be aligned.
+    """
+    models = []
+    for i in range(n_models):
+        model = generate_params_and_info(n_params, n_levels, seed=i)
+        model["params"] = model["params"].iloc[: n_params - min(i, n_params // 2)]
+        models.append(model)
+    return models
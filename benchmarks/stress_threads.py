@@ -0,0 +1,128 @@
+"""
+Stress test of concurrent rendering.
+
+Usage from the root of the repository: ``python -m benchmarks.stress_threads``.
+Many threads render a shared Stargazer and views of it with different options
+in HTML and LaTeX at the same time, and every result is compared with the
+result of rendering the same options in a single thread.
+
+With ``--lazy`` the summary statistics of the shared models are computed lazily,
+slowly and only when a render first needs them, like the F-test of statsmodels
+results, and the test also checks that every statistic was computed only once.
+
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from estimagic_stargazer.stargazer_function import LazyInfo, Stargazer
+
+from .common import generate_models
+
+VARIANTS = [
+    {},
+    {"title_text": "Title", "model_name": "Model"},
+    {"confidence_intervals": True, "sig_digits": 2},
+    {"sig_levels": (0.2, 0.1), "show_sig": False},
+    {"custom_notes": ("note",), "notes_append": False, "show_dof": True},
+    {"show_precision": False, "show_footer": False},
+]
+
+
+def render(stargazer, variant, table_type):
+    """Render a variant of a table in HTML or LaTeX."""
+    table = stargazer.with_options(**variant) if variant else stargazer
+    if table_type == "html":
+        return table.render_html()
+    return table.render_latex()
+
+
+def make_lazy(models, calls, delay=0.001):
+    """Replace the info of every model by a LazyInfo whose values are computed
+    slowly and counted in calls."""
+    lock = threading.Lock()
+
+    def getter(j, key, value):
+        def compute():
+            time.sleep(delay)
+            with lock:
+                calls[j, key] += 1
+            return value
+
+        return compute
+
+    for j, model in enumerate(models):
+        info = model["info"]
+        model["info"] = LazyInfo({key: getter(j, key, info[key]) for key in info})
+    return models
+
+
+def run(
+    n_threads=32,
+    n_renders=2000,
+    n_models=5,
+    n_params=500,
+    n_levels=2,
+    seed=0,
+    lazy=False,
+):
+    """Render random variants of a table from n_threads threads.
+
+    Returns:
+        int: number of renders whose result differed from the expected one, plus
+            the number of lazy statistics that were computed more than once.
+    """
+    models = generate_models(n_models, n_params, n_levels)
+    calls = Counter()
+    if lazy:
+        models = make_lazy(models, calls)
+    shared = Stargazer(models)
+    reference = Stargazer(generate_models(n_models, n_params, n_levels))
+    expected = {
+        (i, table_type): render(reference, variant, table_type)
+        for i, variant in enumerate(VARIANTS)
+        for table_type in ["html", "latex"]
+    }
+    rng = random.Random(seed)
+    tasks = [
+        (rng.randrange(len(VARIANTS)), rng.choice(["html", "latex"]))
+        for _ in range(n_renders)
+    ]
+
+    def check(task):
+        i, table_type = task
+        return render(shared, VARIANTS[i], table_type) == expected[task]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(n_threads) as executor:
+        results = list(executor.map(check, tasks))
+    seconds = time.perf_counter() - start
+    failures = results.count(False)
+    print(
+        "{} renders in {} threads: {:.2f} s, {} wrong".format(
+            n_renders, n_threads, seconds, failures
+        )
+    )
+    if lazy:
+        repeated = sum(1 for n in calls.values() if n > 1)
+        print(
+            "{} lazy statistics computed, {} more than once".format(
+                len(calls), repeated
+            )
+        )
+        failures += repeated
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--renders", type=int, default=2000)
+    parser.add_argument("--lazy", action="store_true")
+    args = parser.parse_args()
+    sys.exit(1 if run(args.threads, args.renders, lazy=args.lazy) else 0)
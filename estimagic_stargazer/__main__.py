@@ -0,0 +1,41 @@
+"""
+Render the tables of a manifest from the command line.
+
+Usage: ``python -m estimagic_stargazer manifest.json [--state FILE] [--force]``.
+See the batch module for the format of the manifest.
+
+"""
+
+import argparse
+from collections import Counter
+
+from .batch import build_manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m estimagic_stargazer",
+        description="Render the tables of a manifest whose inputs changed.",
+    )
+    parser.add_argument("manifest", help="JSON manifest of the tables")
+    parser.add_argument(
+        "--state",
+        help="file with the hashes of the inputs of the last run (default: "
+        ".stargazer-state.json next to the manifest)",
+    )
+    parser.add_argument("--force", action="store_true", help="render all tables again")
+    args = parser.parse_args(argv)
+
+    results = build_manifest(args.manifest, args.state, args.force)
+    for result in results:
+        print("{:9} {}".format(result.status, result.output))
+    counts = Counter(result.status for result in results)
+    print(
+        "{} written, {} unchanged, {} skipped".format(
+            counts["written"], counts["unchanged"], counts["skipped"]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Incremental rendering of the tables listed in a manifest.
+
+A manifest is a JSON file of the form::
+
+    {
+        "tables": [
+            {
+                "models": ["results/ols.pickle", "results/iv.pickle"],
+                "output": "tex_tables/table1.tex",
+                "format": "latex",
+                "options": {
+                    "title": "Results",
+                    "custom_columns": {"args": [["OLS", "IV"], [1, 1]]}
+                }
+            },
+            {
+                "models": "results/extracted.npz",
+                "output": "html/table2.html",
+                "format": "html"
+            }
+        ]
+    }
+
+Models are pickled regression results (statsmodels results, dictionaries or
+namedtuples) or a single ``.npz`` file written by Stargazer.save_extracted.
+Only unpickle files you trust. Options are a table_dict as in Stargazer_table,
+where an object with the single key "args" stands for a tuple of arguments.
+The formats are "html", "latex", "latex_tabular" (only the tabular
+environment), "markdown" and "ascii". Relative paths are relative to the
+directory of the manifest.
+
+A hash of the contents of the model files, the options and the format of every
+table is stored in a state file next to the manifest. Tables whose hash did not
+change since the last run and whose output exists are skipped without loading
+their models, and outputs are only written if their content changed, so that
+builds depending on them are not triggered needlessly.
+
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections import namedtuple
+from pathlib import Path
+
+from .cache import CACHE_VERSION, canonical_repr
+from .stargazer_function import Stargazer, apply_table_dict
+
+STATE_VERSION = 1
+
+DEFAULT_STATE_FILE = ".stargazer-state.json"
+
+RENDERERS = {
+    "html": lambda s: s.render_html(),
+    "latex": lambda s: s.render_latex(),
+    "latex_tabular": lambda s: s.render_latex(only_tabular=True),
+    "markdown": lambda s: s.render_markdown(),
+    "ascii": lambda s: s.render_ascii(),
+}
+
+# status is "skipped" (inputs unchanged), "unchanged" (rendered, but the
+# output already had this content) or "written"
+BuildResult = namedtuple("BuildResult", "output status")
+
+
+def build_manifest(manifest_path, state_path=None, force=False):
+    """Render the tables of a manifest whose inputs changed since the last run.
+
+    Args:
+        manifest_path (str or pathlib.Path): JSON manifest, see module docstring.
+        state_path (str or pathlib.Path): file storing the hashes of the inputs.
+            Default is ".stargazer-state.json" in the directory of the manifest.
+        force (bool): whether to render all tables, even if their inputs did not
+            change.
+
+    Returns:
+        list: BuildResult namedtuples in the order of the manifest.
+    """
+    manifest_path = Path(manifest_path)
+    root = manifest_path.parent
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    state_path = root / DEFAULT_STATE_FILE if state_path is None else Path(state_path)
+    state = _read_state(state_path)
+
+    file_hashes = {}
+    results = []
+    try:
+        for table in manifest["tables"]:
+            table_format = table.get("format", "latex")
+            if table_format not in RENDERERS:
+                raise ValueError(
+                    "format must be one of {}, not {}".format(
+                        sorted(RENDERERS), table_format
+                    )
+                )
+            output = root / table["output"]
+            model_paths = table["models"]
+            if not isinstance(model_paths, list):
+                model_paths = [model_paths]
+            model_paths = [root / path for path in model_paths]
+            options = _parse_options(table.get("options", {}))
+
+            for path in model_paths:
+                if path not in file_hashes:
+                    file_hashes[path] = hash_file(path)
+            inputs = [
+                CACHE_VERSION,
+                table_format,
+                [file_hashes[path] for path in model_paths],
+                options,
+            ]
+            input_hash = hashlib.blake2b(
+                canonical_repr(inputs).encode(), digest_size=20
+            ).hexdigest()
+            key = str(output.resolve())
+            if not force and state.get(key) == input_hash and output.exists():
+                results.append(BuildResult(output, "skipped"))
+                continue
+
+            stargazer = load_models(model_paths)
+            apply_table_dict(stargazer, options)
+            written = write_if_changed(output, RENDERERS[table_format](stargazer))
+            state[key] = input_hash
+            results.append(BuildResult(output, "written" if written else "unchanged"))
+    finally:
+        _write_state(state_path, state)
+    return results
+
+
+def load_models(model_paths):
+    """Create a Stargazer from pickled models or a file of extracted data.
+
+    Args:
+        model_paths (list): paths of pickled regression results, or a single
+            path of an ``.npz`` file written by Stargazer.save_extracted.
+
+    Returns:
+        Stargazer
+    """
+    if any(Path(path).suffix == ".npz" for path in model_paths):
+        if len(model_paths) != 1:
+            raise ValueError(
+                "A table with extracted data (.npz) cannot have other models."
+            )
+        return Stargazer.load_extracted(model_paths[0])
+    models = []
+    for path in model_paths:
+        with open(path, "rb") as f:
+            models.append(pickle.load(f))
+    return Stargazer(models, slim=True)
+
+
+def hash_file(path, block_size=2**20):
+    """Hash the contents of a file.
+
+    Args:
+        path (str or pathlib.Path): the file.
+        block_size (int): number of bytes read at once.
+
+    Returns:
+        str: hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_if_changed(path, content):
+    """Write content to a file, unless the file already has this content.
+
+    Args:
+        path (str or pathlib.Path): the file. Missing directories are created.
+        content (str): the new content.
+
+    Returns:
+        bool: whether the file was written.
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _parse_options(options):
+    """Turn {"args": [...]} values of manifest options into tuples."""
+    return {
+        key: (
+            tuple(value["args"])
+            if isinstance(value, dict) and list(value) == ["args"]
+            else value
+        )
+        for key, value in options.items()
+    }
+
+
+def _read_state(state_path):
+    """Read the input hashes of the last run, or nothing if they do not fit."""
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state["tables"]
+
+
+def _write_state(state_path, tables):
+    """Store the input hashes of the tables."""
+    write_if_changed(
+        state_path,
+        json.dumps({"version": STATE_VERSION, "tables": tables}, indent=2),
+    )
@@ -0,0 +1,193 @@
+"""
+Content-addressed cache of rendered tables.
+
+A rendered table is stored in a local directory under a hash of everything it is
+rendered from: the parameters and summary statistics of its models, its options
+and its table type. A table whose inputs did not change since it was cached is
+therefore read from the directory, without extracting the data of the models or
+rendering it again. The least recently used tables are deleted once the
+directory gets larger than a given size.
+
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# changed whenever tables would be rendered differently from the same inputs
+CACHE_VERSION = 1
+
+SUFFIX = ".table"
+
+
+def fingerprint_model(model, info_keys=None):
+    """Hash the parameters and summary statistics of a model.
+
+    The parameter DataFrame is hashed row by row with pandas, which is fast even
+    for many parameters. Lazily computed statistics are computed if they are
+    hashed, so only the statistics a table shows should be.
+
+    Args:
+        model (namedtuple): model with fields params (pd.DataFrame) and info
+            (dict or LazyInfo), as returned by validate_model.
+        info_keys (list): keys of info that are hashed, if the model has them.
+            Default is all keys.
+
+    Returns:
+        str: hexadecimal digest.
+    """
+    params = model.params
+    info = model.info
+    if info_keys is None:
+        info_keys = list(info)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(canonical_repr(list(params.columns)).encode())
+    digest.update(canonical_repr(list(params.index.names)).encode())
+    digest.update(pd.util.hash_pandas_object(params, index=True).to_numpy().tobytes())
+    stats = {key: info[key] for key in info_keys if key in info}
+    digest.update(canonical_repr(stats).encode())
+    return digest.hexdigest()
+
+
+def canonical_repr(value):
+    """Represent nested lists, tuples and dicts of options as a string that
+    does not depend on the order of dictionary keys.
+
+    Args:
+        value: option value or summary statistic.
+
+    Returns:
+        str
+    """
+    if isinstance(value, dict):
+        items = sorted((repr(key), canonical_repr(val)) for key, val in value.items())
+        return "{" + ", ".join(key + ": " + val for key, val in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return (
+            type(value).__name__
+            + "("
+            + ", ".join(canonical_repr(val) for val in value)
+            + ")"
+        )
+    return repr(value)
+
+
+class TableCache:
+    """Directory of rendered tables addressed by the hash of their inputs.
+
+    Reading a table marks it as recently used. Whenever a table is stored, the
+    least recently used tables are deleted until all tables together take at
+    most max_bytes. hits, misses and evictions count the lookups that found a
+    table, the lookups that did not and the deleted tables of this object.
+
+    Several processes can share a directory, because tables are written to a
+    temporary file first and then renamed.
+
+    Args:
+        directory (str or pathlib.Path): directory of the cache. It is created
+            if it does not exist.
+        max_bytes (int): maximal size of all cached tables.
+    """
+
+    def __init__(self, directory, max_bytes=100 * 2**20):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def key(self, model_fingerprints, table_dict, table_type):
+        """Compute the key of a table.
+
+        Args:
+            model_fingerprints (list): fingerprint_model of every model.
+            table_dict (dict): options as in Stargazer_table.
+            table_type (str): "html" or "latex".
+
+        Returns:
+            str: hexadecimal digest.
+        """
+        inputs = [CACHE_VERSION, table_type, list(model_fingerprints), table_dict]
+        return hashlib.blake2b(
+            canonical_repr(inputs).encode(), digest_size=20
+        ).hexdigest()
+
+    def get(self, key):
+        """Return the table cached under key, or None if there is none."""
+        path = self.directory / (key + SUFFIX)
+        try:
+            with open(path, encoding="utf-8", newline="") as f:
+                table = f.read()
+            # the modification time orders the tables by their last use
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return table
+
+    def put(self, key, table):
+        """Store a table under key and evict the least recently used tables."""
+        path = self.directory / (key + SUFFIX)
+        tmp_path = path.with_name(
+            "{}.{}-{}.tmp".format(key, os.getpid(), threading.get_ident())
+        )
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(table)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used tables until the cache is small
+        enough."""
+        entries = []
+        for path in self.directory.glob("*" + SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.evictions += 1
+            total -= size
+
+    def size(self):
+        """Return the number of bytes all cached tables take."""
+        return sum(path.stat().st_size for path in self.directory.glob("*" + SUFFIX))
+
+    def clear(self):
+        """Delete all cached tables."""
+        for path in self.directory.glob("*" + SUFFIX):
+            path.unlink()
+
+    def render(self, models, table_dict=None, table_type="html"):
+        """Render a table with Stargazer_table, or read it from the cache.
+
+        Args:
+            models: regression result or list of results, see Stargazer_table.
+            table_dict (dict): options, see Stargazer_table.
+            table_type (str): "html" or "latex".
+
+        Returns:
+            str: the rendered table.
+        """
+        from .stargazer_function import Stargazer_table, TableSpec
+
+        spec = TableSpec(models, table_dict or {}, table_type)
+        return Stargazer_table([spec], n_jobs=1, cache=self)[0].table
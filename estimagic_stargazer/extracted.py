@@ -0,0 +1,118 @@
+"""
+Storage of the data Stargazer extracts from models.
+
+The aligned parameter arrays, the parameter names and the summary statistics of
+the models of a table are written into a single uncompressed (or, on request,
+compressed) NumPy ``.npz`` file. Loading it takes a few milliseconds and neither
+needs the models nor statsmodels, so that tables can be rendered again without
+unpickling large results objects.
+
+"""
+
+import json
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+
+ALIGNED_KEYS = [
+    "present",
+    "param_values",
+    "param_std_err",
+    "p_values",
+    "ci_lower",
+    "ci_upper",
+]
+
+# param_index (pd.Index), aligned_data (dict of arrays), model_data (one dict
+# with the summary statistics per model) and param_order of a Stargazer
+ExtractedData = namedtuple(
+    "ExtractedData", "param_index aligned_data model_data param_order"
+)
+
+
+def save_extracted(path, data, compressed=False):
+    """Write the extracted data of a table into an ``.npz`` file.
+
+    The summary statistics are stored with their types, because e.g. the number
+    of observations is shown as it is.
+
+    Args:
+        path (str or pathlib.Path): file to write. Unlike np.savez, no suffix
+            is appended.
+        data (ExtractedData): data to write.
+        compressed (bool): whether to compress the arrays, which makes the
+            file smaller but saving and loading slower.
+    """
+    index = data.param_index
+    arrays = {key: data.aligned_data[key] for key in ALIGNED_KEYS}
+    for i in range(index.nlevels):
+        arrays["index_level_{}".format(i)] = _level_array(index.get_level_values(i))
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "param_order": data.param_order,
+        "index_names": [_json_value(name) for name in index.names],
+        "model_data": [
+            {key: _json_value(value) for key, value in md.items()}
+            for md in data.model_data
+        ],
+    }
+    arrays["meta"] = np.array(json.dumps(meta))
+    savez = np.savez_compressed if compressed else np.savez
+    with open(path, "wb") as f:
+        savez(f, **arrays)
+
+
+def read_extracted(path):
+    """Read the extracted data of a table from an ``.npz`` file.
+
+    Args:
+        path (str or pathlib.Path): file written by save_extracted.
+
+    Returns:
+        ExtractedData
+    """
+    with np.load(path, allow_pickle=False) as arrays:
+        meta = json.loads(str(arrays["meta"]))
+        if meta["format_version"] != FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported format version {} of extracted data in {}".format(
+                    meta["format_version"], path
+                )
+            )
+        names = meta["index_names"]
+        levels = [arrays["index_level_{}".format(i)] for i in range(len(names))]
+        aligned_data = {key: arrays[key] for key in ALIGNED_KEYS}
+
+    if len(levels) == 1:
+        param_index = pd.Index(levels[0], name=names[0])
+    else:
+        param_index = pd.MultiIndex.from_arrays(levels, names=names)
+    model_data = [
+        {key: np.nan if value is None else value for key, value in md.items()}
+        for md in meta["model_data"]
+    ]
+    return ExtractedData(param_index, aligned_data, model_data, meta["param_order"])
+
+
+def _level_array(values):
+    """Convert the labels of an index level into an array without objects."""
+    values = values.to_numpy()
+    if values.dtype != object:
+        return values
+    if not all(isinstance(value, str) for value in values):
+        raise TypeError(
+            "Only parameter names that are strings or numbers can be saved."
+        )
+    return values.astype(str)
+
+
+def _json_value(value):
+    """Convert a summary statistic or name into a value JSON can store."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
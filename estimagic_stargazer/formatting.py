@@ -0,0 +1,68 @@
+"""
+Vectorized formatting of regression results.
+
+The functions in this module turn whole blocks of numbers (e.g. all parameter
+values of all models) into arrays of strings in one pass, instead of rounding
+and converting every cell separately.
+
+"""
+
+import numpy as np
+
+
+def format_numbers(values, digits):
+    """Round numbers and convert them to strings.
+
+    Args:
+        values (array-like): numbers of any shape.
+        digits (int): number of decimal digits to round to.
+
+    Returns:
+        np.ndarray: object array of strings with the same shape as values.
+            Missing values are turned into empty strings.
+    """
+    values = np.asarray(values, dtype=float)
+    formatted = np.round(values, digits).astype(str).astype(object)
+    formatted[np.isnan(values)] = ""
+    return formatted
+
+
+def format_intervals(lower, upper, digits):
+    """Format confidence intervals as "lower , upper" strings.
+
+    Args:
+        lower (array-like): lower bounds of the intervals.
+        upper (array-like): upper bounds of the intervals, same shape as lower.
+        digits (int): number of decimal digits to round to.
+
+    Returns:
+        np.ndarray: object array of strings with the same shape as lower.
+            Intervals with a missing bound are turned into empty strings.
+    """
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    formatted = np.char.add(
+        np.char.add(np.round(lower, digits).astype(str), " , "),
+        np.round(upper, digits).astype(str),
+    ).astype(object)
+    formatted[np.isnan(lower) | np.isnan(upper)] = ""
+    return formatted
+
+
+def significance_stars(p_values, sig_levels):
+    """Convert p-values into significance stars.
+
+    A p-value gets one star for every significance level it is strictly smaller
+    than. Missing p-values get no stars.
+
+    Args:
+        p_values (array-like): p-values of any shape.
+        sig_levels (list): significance levels.
+
+    Returns:
+        np.ndarray: object array of star strings with the same shape as p_values.
+    """
+    levels = np.sort(np.asarray(sig_levels, dtype=float))
+    star_table = np.array(["*" * n for n in range(len(levels), -1, -1)], dtype=object)
+    positions = np.searchsorted(levels, np.asarray(p_values, dtype=float), side="right")
+    return star_table[positions]
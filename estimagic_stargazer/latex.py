@@ -0,0 +1,323 @@
+"""
+LaTeX documents bundling many Stargazer tables.
+
+Instead of wrapping every table into its own document with a large preamble,
+as in ``tex_tables/table.tex``, all tables are written into a single document
+with one preamble, so that one LaTeX run typesets all of them. Tables can be put
+on separate pages and listed in a table of contents.
+
+Documents can be compiled into PDFs with a locally installed pdflatex or
+lualatex. Every compilation runs in its own temporary directory, so that many
+documents are compiled concurrently, and the PDFs are cached under the hash of
+their source, so that unchanged documents are not compiled again.
+
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .stargazer_function import _join_or_write
+
+LATEX_ENGINES = ["pdflatex", "lualatex"]
+
+# an error from the log of a LaTeX run; line is None if it is not known
+LatexError = namedtuple("LatexError", "message line")
+
+# output is the path of the PDF, or None if the compilation failed; log is the
+# log of the failed LaTeX run
+CompileResult = namedtuple(
+    "CompileResult", "output source_hash cached seconds errors log"
+)
+
+# a custom preamble has to load tabularx and, without page breaks, placeins
+DEFAULT_PREAMBLE = r"""\documentclass[11pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage[margin=2cm]{geometry}
+\usepackage{amsmath}
+\usepackage{tabularx}
+\usepackage{placeins}
+"""
+
+
+def render_latex_document(
+    tables,
+    headings=None,
+    toc=False,
+    page_breaks=False,
+    only_tabular=False,
+    preamble=DEFAULT_PREAMBLE,
+    stream=None,
+):
+    """Render many tables into one LaTeX document.
+
+    Args:
+        tables (list): Stargazer objects or tables already rendered in LaTeX.
+        headings (list): section heading of every table. Default is no sections,
+            or with toc the titles of the tables (or "Table 1", ...).
+        toc (bool): whether to start with a table of contents of the sections.
+        page_breaks (bool): whether to put every table on its own page. Else
+            floating tables are kept in order by placeins' FloatBarrier.
+        only_tabular (bool): whether to render Stargazer objects without the
+            table environment, see Stargazer.render_latex.
+        preamble (str): everything before ``\\begin{document}``.
+        stream (file-like object): if given, the document is written to it
+            chunk by chunk instead of being returned.
+
+    Returns:
+        str: the document, or None if it was written to stream.
+    """
+    chunks = iter_latex_document(
+        tables, headings, toc, page_breaks, only_tabular, preamble
+    )
+    return _join_or_write(chunks, stream)
+
+
+def iter_latex_document(
+    tables,
+    headings=None,
+    toc=False,
+    page_breaks=False,
+    only_tabular=False,
+    preamble=DEFAULT_PREAMBLE,
+):
+    """Yield a LaTeX document of many tables in pieces. See
+    render_latex_document for the arguments."""
+    tables = list(tables)
+    if headings is None and toc:
+        headings = [_default_heading(table, i) for i, table in enumerate(tables)]
+    if headings is not None and len(headings) != len(tables):
+        raise ValueError("There must be one heading per table.")
+
+    yield preamble.rstrip("\n") + "\n\\begin{document}\n"
+    if toc:
+        yield "\\tableofcontents\n\\clearpage\n"
+    for i, table in enumerate(tables):
+        if headings is not None:
+            yield "\\section{" + headings[i] + "}\n"
+        if isinstance(table, str):
+            yield table
+        else:
+            yield from table.iter_latex(only_tabular=only_tabular)
+        yield "\n\\clearpage\n" if page_breaks else "\n\\FloatBarrier\n"
+    yield "\\end{document}\n"
+
+
+def _default_heading(table, i):
+    """Use the title of a Stargazer table as its heading, or its number."""
+    title = getattr(table, "title_text", None)
+    return title if title else "Table " + str(i + 1)
+
+
+def find_latex_engine(engines=LATEX_ENGINES):
+    """Find the first of the LaTeX engines that is installed.
+
+    Args:
+        engines (list): names of the engines in the order of preference.
+
+    Returns:
+        str: path of the engine, or None if none of them is installed.
+    """
+    for engine in engines:
+        path = shutil.which(engine)
+        if path is not None:
+            return path
+    return None
+
+
+def compile_latex(
+    source, output=None, engine=None, cache_dir=None, runs=None, timeout=120
+):
+    """Compile a LaTeX document into a PDF.
+
+    The document is compiled in a new temporary directory. With a cache
+    directory, the PDF is stored there under the hash of the source and the
+    engine, and documents that were compiled before are copied from there
+    instead of being compiled.
+
+    Args:
+        source (str): complete LaTeX document, e.g. from render_latex_document.
+        output (str or pathlib.Path): path the PDF is copied to. Can only be
+            omitted with a cache directory, in which the PDF is left then.
+        engine (str): name or path of the LaTeX engine. Default is the first
+            installed one of LATEX_ENGINES.
+        cache_dir (str or pathlib.Path): directory of cached PDFs.
+        runs (int): number of LaTeX runs. Default is two for documents with a
+            table of contents and one otherwise.
+        timeout (float): seconds after which a LaTeX run is stopped.
+
+    Returns:
+        CompileResult
+    """
+    start = time.perf_counter()
+    if output is None and cache_dir is None:
+        raise ValueError("Either output or cache_dir must be given.")
+    engine = engine or find_latex_engine()
+    if engine is None:
+        raise RuntimeError(
+            "No LaTeX engine found, install one of {}.".format(LATEX_ENGINES)
+        )
+    source_hash = hashlib.blake2b(
+        (Path(engine).name + "\0" + source).encode("utf-8"), digest_size=20
+    ).hexdigest()
+    cached_pdf = None
+    if cache_dir is not None:
+        cached_pdf = Path(cache_dir) / (source_hash + ".pdf")
+        if cached_pdf.exists():
+            if output is not None:
+                shutil.copyfile(cached_pdf, output)
+            return CompileResult(
+                Path(output or cached_pdf),
+                source_hash,
+                True,
+                time.perf_counter() - start,
+                [],
+                None,
+            )
+    if runs is None:
+        runs = 2 if "\\tableofcontents" in source else 1
+
+    with tempfile.TemporaryDirectory(prefix="stargazer-") as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        (tmp_dir / "document.tex").write_text(source, encoding="utf-8")
+        command = [
+            engine,
+            "-interaction=nonstopmode",
+            "-halt-on-error",
+            "-no-shell-escape",
+            "document.tex",
+        ]
+        for _ in range(runs):
+            try:
+                process = subprocess.run(
+                    command,
+                    cwd=tmp_dir,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                error = LatexError("Timeout after {} seconds".format(timeout), None)
+                return CompileResult(
+                    None, source_hash, False, time.perf_counter() - start, [error], None
+                )
+            if process.returncode != 0:
+                break
+
+        pdf = tmp_dir / "document.pdf"
+        if process.returncode != 0 or not pdf.exists():
+            log_path = tmp_dir / "document.log"
+            if log_path.exists():
+                log = log_path.read_text(encoding="utf-8", errors="replace")
+            else:
+                log = process.stdout.decode("utf-8", errors="replace")
+            errors = parse_latex_errors(log) or [
+                LatexError(
+                    "{} exited with code {}".format(engine, process.returncode), None
+                )
+            ]
+            return CompileResult(
+                None, source_hash, False, time.perf_counter() - start, errors, log
+            )
+        if cached_pdf is not None:
+            cached_pdf.parent.mkdir(parents=True, exist_ok=True)
+            # copy and rename, so that other threads never see half a PDF
+            tmp_pdf = cached_pdf.with_name(
+                "{}.{}-{}.tmp".format(
+                    cached_pdf.name, os.getpid(), threading.get_ident()
+                )
+            )
+            shutil.copyfile(pdf, tmp_pdf)
+            os.replace(tmp_pdf, cached_pdf)
+        if output is not None:
+            shutil.copyfile(pdf, output)
+    return CompileResult(
+        Path(output or cached_pdf),
+        source_hash,
+        False,
+        time.perf_counter() - start,
+        [],
+        None,
+    )
+
+
+def compile_tables(
+    tables,
+    outputs=None,
+    n_jobs=None,
+    engine=None,
+    cache_dir=None,
+    preamble=DEFAULT_PREAMBLE,
+    timeout=120,
+):
+    """Compile every table into its own PDF, concurrently.
+
+    Args:
+        tables (list): Stargazer objects or tables already rendered in LaTeX.
+        outputs (list): path of the PDF of every table. Can only be omitted with
+            a cache directory, see compile_latex.
+        n_jobs (int): number of LaTeX runs at the same time. None uses one per
+            core.
+        engine (str): name or path of the LaTeX engine, see compile_latex.
+        cache_dir (str or pathlib.Path): directory of cached PDFs.
+        preamble (str): preamble of the documents, see render_latex_document.
+        timeout (float): seconds after which a LaTeX run is stopped.
+
+    Returns:
+        list: CompileResult namedtuples in the order of tables.
+    """
+    engine = engine or find_latex_engine()
+    if engine is None:
+        raise RuntimeError(
+            "No LaTeX engine found, install one of {}.".format(LATEX_ENGINES)
+        )
+    sources = [render_latex_document([table], preamble=preamble) for table in tables]
+    if outputs is None:
+        outputs = [None] * len(sources)
+    with ThreadPoolExecutor(max_workers=n_jobs or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                compile_latex,
+                source,
+                output,
+                engine=engine,
+                cache_dir=cache_dir,
+                timeout=timeout,
+            )
+            for source, output in zip(sources, outputs)
+        ]
+        return [future.result() for future in futures]
+
+
+def parse_latex_errors(log):
+    """Collect the errors from the log of a LaTeX run.
+
+    Args:
+        log (str): contents of the log file.
+
+    Returns:
+        list: LatexError namedtuples with the error messages (lines starting
+            with "!") and the line numbers of the source they refer to.
+    """
+    errors = []
+    lines = log.splitlines()
+    for i, line in enumerate(lines):
+        if not line.startswith("!"):
+            continue
+        number = None
+        for following in lines[i + 1 : i + 20]:
+            match = re.match(r"l\.(\d+)", following)
+            if match:
+                number = int(match.group(1))
+                break
+        errors.append(LatexError(line[1:].strip(), number))
+    return errors
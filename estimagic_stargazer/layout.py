@@ -0,0 +1,245 @@
+"""
+Renderer independent layout of Stargazer tables.
+
+A TableLayout contains everything a table shows: a few header rows of cells
+with their column spans and styles, the rows and labels of the body, the
+formatted summary statistics of the footer and the notes. The parameter cells of
+the body are formatted by format_body for one slice of rows at a time, so that
+streaming renderers only hold the cells of the rows they are serializing.
+Renderers that return the whole table cache the cells of every slice instead,
+so that the HTML, LaTeX, Markdown, ASCII and template renderers share them.
+
+The header, body, footer and notes are built by separate functions and every
+part only depends on the options listed for it in LAYOUT_OPTIONS, so that a
+part (and everything rendered from it) only has to be rebuilt if one of these
+options changes.
+
+"""
+
+from collections import namedtuple
+from collections.abc import Mapping
+
+import numpy as np
+
+from .formatting import significance_stars
+
+# a header cell spanning span model columns; style is None, "italic" (model
+# name), "center" (a single column label) or "left" (column label of a group)
+Cell = namedtuple("Cell", "text span style")
+
+# kind is "model_name", "column_labels" or "model_numbers"
+HeaderRow = namedtuple("HeaderRow", "kind cells")
+
+# positions of the rows of the aligned arrays in the order of the table and an
+# object array of strings with their labels, one column per label column
+BodyRows = namedtuple("BodyRows", "positions labels")
+
+# object arrays of strings with one row per parameter of a slice of the body;
+# labels has one column per label column and the other arrays one column per
+# model. stars is None if they are not shown and precision is None if neither
+# standard errors nor confidence intervals are shown.
+BodyCells = namedtuple("BodyCells", "labels values stars precision present")
+
+# sig_levels is None if the significance legend is not appended
+Notes = namedtuple("Notes", "label sig_levels custom")
+
+# body is a BodyRows; footer (list of StatRow) and notes are None if they are
+# not shown; options is the RenderOptions snapshot the body is formatted with
+# and cache_body whether the formatted cells of the body are cached
+TableLayout = namedtuple(
+    "TableLayout",
+    "num_label_columns num_models show_header title header body footer notes "
+    "options cache_body",
+)
+
+# attributes of Stargazer that each part of the layout depends on
+LAYOUT_OPTIONS = {
+    "header": [
+        "title_text",
+        "show_header",
+        "model_name",
+        "column_labels",
+        "column_separators",
+        "show_model_nums",
+    ],
+    "body": ["param_names", "param_nicer_names"],
+    # the parameter cells of the body, formatted per slice by format_body
+    "cells": [
+        "param_names",
+        "show_precision",
+        "show_sig",
+        "sig_levels",
+        "sig_digits",
+        "confidence_intervals",
+    ],
+    "footer": [
+        "show_footer",
+        "show_n",
+        "show_r2",
+        "show_residual_std_err",
+        "show_f_statistic",
+        "show_dof",
+        "sig_levels",
+        "sig_digits",
+    ],
+    "notes": [
+        "show_notes",
+        "notes_label",
+        "notes_append",
+        "custom_notes",
+        "sig_levels",
+    ],
+}
+
+
+def freeze_option(value):
+    """Convert an option value into a comparable and hashable value.
+
+    Lists are converted to tuples and mappings to tuples of their items. Their
+    elements are not converted, because the options only contain hashable
+    elements (e.g. parameter names) and converting e.g. a long list of
+    parameter names element by element would be slow.
+
+    Args:
+        value: value of a rendering option.
+
+    Returns:
+        the frozen value.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, Mapping):
+        return tuple(value.items())
+    return value
+
+
+def build_header(s, options):
+    """Collect the model name, column labels and model numbers of a table."""
+    rows = []
+    if options.model_name is not None:
+        cells = [Cell(options.model_name, s.num_models, "italic")]
+        rows.append(HeaderRow("model_name", cells))
+    if options.column_labels is not None:
+        if type(options.column_labels) == str:
+            cells = [Cell(options.column_labels, s.num_models, "center")]
+        else:
+            cells = [
+                Cell(label, span, "left")
+                for label, span in zip(options.column_labels, options.column_separators)
+            ]
+        rows.append(HeaderRow("column_labels", cells))
+    if options.show_model_nums:
+        cells = [Cell("(" + str(n) + ")", 1, None) for n in range(1, s.num_models + 1)]
+        rows.append(HeaderRow("model_numbers", cells))
+    return rows
+
+
+def build_body(s, options):
+    """Collect the positions and labels of all rows of a table."""
+    positions = np.array(
+        [s.param_positions[p] for p in options.param_names], dtype=np.intp
+    )
+    labels = s.row_labels(options.param_names)
+    if options.param_nicer_names is not None:
+        names = options.param_nicer_names
+        labels[:, -1] = [names.get(name, name) for name in labels[:, -1]]
+    return BodyRows(positions, labels.astype(str).astype(object))
+
+
+def format_body(s, layout, rows, models=None):
+    """Format the parameter cells of a slice of the rows of a table body.
+
+    Args:
+        s (Stargazer): the table.
+        layout (TableLayout): its layout.
+        rows (slice): rows of the body, e.g. from row_slices.
+        models (list): positions of the models whose cells are formatted.
+            Default is all models.
+
+    Returns:
+        BodyCells
+    """
+    options = layout.options
+    positions = layout.body.positions[rows]
+    if models is None:
+        models = slice(None)
+    cells = s.format_param_cells(positions, options, models)
+    stars = None
+    if options.show_sig:
+        stars = significance_stars(
+            s.aligned_data["p_values"][positions][:, models], options.sig_levels
+        )
+    return BodyCells(
+        labels=layout.body.labels[rows],
+        values=cells["param_values"],
+        stars=stars,
+        precision=cells["precision"] if options.show_precision else None,
+        present=s.aligned_data["present"][positions][:, models],
+    )
+
+
+def select_models(cells, models):
+    """Select the columns of some models from the BodyCells of all models."""
+    return cells._replace(
+        values=cells.values[:, models],
+        stars=None if cells.stars is None else cells.stars[:, models],
+        precision=None if cells.precision is None else cells.precision[:, models],
+        present=cells.present[:, models],
+    )
+
+
+def build_footer(s, options):
+    """Format the model summary statistics, or return None if not shown."""
+    return s.format_stat_rows(options) if options.show_footer else None
+
+
+def build_notes(s, options):
+    """Collect the notes of a table, or return None if they are not shown."""
+    if not options.show_notes:
+        return None
+    sig_levels = sorted(options.sig_levels) if options.notes_append else None
+    return Notes(options.notes_label, sig_levels, list(options.custom_notes))
+
+
+def row_slices(num_rows, chunk_size):
+    """Split the rows of a table body into slices of at most chunk_size rows.
+
+    Args:
+        num_rows (int): number of rows.
+        chunk_size (int): maximal number of rows per slice.
+
+    Returns:
+        list: slice objects.
+    """
+    return [
+        slice(start, start + chunk_size) for start in range(0, num_rows, chunk_size)
+    ]
+
+
+def expand_cells(cells, italic_format="{}"):
+    """Put the text of header cells into the first of the columns they span.
+
+    Args:
+        cells (list): Cell namedtuples.
+        italic_format (str): format string applied to italic cells.
+
+    Returns:
+        list: one string per spanned column.
+    """
+    texts = []
+    for cell in cells:
+        text = italic_format.format(cell.text) if cell.style == "italic" else cell.text
+        texts += [text] + [""] * (cell.span - 1)
+    return texts
+
+
+def join_columns(cells):
+    """Concatenate the strings in every row of a 2d object array.
+
+    Args:
+        cells (np.ndarray): object array of strings with at least one column.
+
+    Returns:
+        np.ndarray: object array with one string per row.
+    """
+    return np.asarray(cells, dtype=object).sum(axis=1)
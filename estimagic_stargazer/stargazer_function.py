@@ -11,10 +11,106 @@ statsmodels linear regression.
 
 """
 
+import asyncio
+import copy
+import threading
+import time
 import numpy as np
 from numpy import round, sqrt, nan, isnan, digitize
 import pandas as pd
 from collections import namedtuple
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+
+from .cache import fingerprint_model
+from .extracted import ExtractedData, read_extracted, save_extracted
+from .formatting import format_intervals, format_numbers, significance_stars
+from .layout import (
+    LAYOUT_OPTIONS,
+    TableLayout,
+    build_body,
+    build_footer,
+    build_header,
+    build_notes,
+    expand_cells,
+    format_body,
+    select_models,
+    freeze_option,
+    join_columns,
+    row_slices,
+)
+
+
+class LazyInfo(MutableMapping):
+    """Dictionary whose values are computed when they are first accessed.
+
+    Each value is computed by a function without arguments and memoized, so that
+    expensive statistics of a model are only computed if a table shows them.
+    Values that are set directly are stored like in a normal dictionary.
+
+    Values are computed under a lock, so that threads reading the same key at
+    the same time compute it only once and never run the functions of one
+    object concurrently (e.g. the F-test of a statsmodels result). The lock is
+    re-entrant, because a function may read other keys of the same object.
+
+    Args:
+        getters (dict): maps keys to functions that compute their values.
+    """
+
+    def __init__(self, getters=None):
+        self._getters = dict(getters or {})
+        self._values = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._values:
+                if key not in self._getters:
+                    raise KeyError(key)
+                self._values[key] = self._getters[key]()
+            return self._values[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            self._getters.pop(key, None)
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self:
+                raise KeyError(key)
+            self._values.pop(key, None)
+            self._getters.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._values or key in self._getters
+
+    def __iter__(self):
+        yield from self._values
+        yield from (key for key in self._getters if key not in self._values)
+
+    def __len__(self):
+        return len(self._values.keys() | self._getters.keys())
+
+    def __repr__(self):
+        items = []
+        for key in self:
+            value = repr(self._values[key]) if key in self._values else "<lazy>"
+            items.append("{!r}: {}".format(key, value))
+        return "LazyInfo({" + ", ".join(items) + "})"
+
+    def __getstate__(self):
+        return {"_getters": self._getters, "_values": self._values}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
 
 # write functions to exctract params dataframe from statsmodels results
@@ -23,15 +119,26 @@ def extract_params_from_sm(model):
     params_list = ["params", "pvalues", "bse"]
     for col in params_list:
         to_concat.append(getattr(model, col))
-    to_concat.append(model.conf_int()[0])
-    to_concat.append(model.conf_int()[1])
+    # conf_int recomputes the intervals on every call
+    conf_int = model.conf_int()
+    to_concat.append(conf_int[0])
+    to_concat.append(conf_int[1])
     params_df = pd.concat(to_concat, axis=1)
     params_df.columns = ["value", "pvalue", "standard_error", "ci_lower", "ci_upper"]
     return params_df
 
 
 def extract_info_from_sm(model):
-    info = {}
+    """Collect the summary statistics of a statsmodels results object.
+
+    The statistics are computed lazily: e.g. the F-test behind fvalue and
+    f_pvalue is only run if the F-statistic is shown in a table. Statistics the
+    results object does not have are missing values.
+
+    Returns:
+        LazyInfo: dictionary-like object mapping the names of the statistics to
+            their values.
+    """
     key_values = [
         "rsquared",
         "rsquared_adj",
@@ -41,28 +148,467 @@ def extract_info_from_sm(model):
         "df_model",
         "df_resid",
     ]
-    for kv in key_values:
-        info[kv] = getattr(model, kv)
+    info = LazyInfo({kv: partial(getattr, model, kv, np.nan) for kv in key_values})
     info["dependent_variable"] = model.model.endog_names
     return info
 
 
-def Stargazer_table(models,table_dict,table_type):
-    """Read arguments from table_dict and create html or Tex table summarizing
-    results of models.
+NamedTup = namedtuple("NamedTup", "params info")
+
+TableSpec = namedtuple(
+    "TableSpec", "models table_dict table_type path", defaults=(None,)
+)
+
+TableResult = namedtuple("TableResult", "table path seconds")
+
+StatRow = namedtuple("StatRow", "stat values stars suffixes")
+
+# wall time of a stage of the extraction or of an HTML or LaTeX render and the
+# size of its output in bytes (None for stages without output); chunk numbers
+# the pieces of a stage, e.g. the body chunks or the models
+StageStats = namedtuple("StageStats", "stage table_type chunk seconds n_bytes")
+
+# all rendering options of a Stargazer, named as its attributes
+RenderOptions = namedtuple(
+    "RenderOptions",
+    [
+        "title_text",
+        "show_header",
+        "model_name",
+        "column_labels",
+        "column_separators",
+        "show_model_nums",
+        "param_names",
+        "param_nicer_names",
+        "show_precision",
+        "show_sig",
+        "sig_levels",
+        "sig_digits",
+        "confidence_intervals",
+        "show_footer",
+        "custom_footer_text",
+        "show_n",
+        "show_r2",
+        "show_adj_r2",
+        "show_residual_std_err",
+        "show_f_statistic",
+        "show_dof",
+        "show_notes",
+        "notes_label",
+        "notes_append",
+        "custom_notes",
+    ],
+)
+
+MODEL_STAT_KEYS = [
+    "r2",
+    "r2_adj",
+    "resid_std_err",
+    "f_statistic",
+    "f_p_value",
+    "degree_freedom",
+    "degree_freedom_resid",
+    "n_obs",
+    "dependent_variable",
+]
+
+# keys of the info of a model that the statistics shown by the footer options
+# are computed from; the number of observations falls back to the degrees of
+# freedom and show_dof adds them to the F-statistic and residual std. error
+FOOTER_INFO_KEYS = {
+    "show_n": ["n_obs", "df_model", "df_resid"],
+    "show_r2": ["rsquared", "rsquared_adj"],
+    "show_residual_std_err": ["scale"],
+    "show_f_statistic": ["fvalue", "f_pvalue"],
+}
+
+# labels of the HTML and template renderers
+HTML_STAT_LABELS = {
+    "n_obs": "Observations",
+    "r2": "R<sup>2</sup>",
+    "r2_adj": "Adjusted R<sup>2</sup>",
+    "resid_std_err": "Residual Std. Error",
+    "f_statistic": "F Statistic",
+}
+
+MARKDOWN_STAT_LABELS = {
+    "n_obs": "Observations",
+    "r2": "R2",
+    "r2_adj": "Adjusted R2",
+    "resid_std_err": "Residual Std. Error",
+    "f_statistic": "F Statistic",
+}
+
+# cells written for models without a statistic
+HTML_EMPTY_STAT_CELLS = {
+    "n_obs": "  ",
+    "r2": " ",
+    "r2_adj": "  ",
+    "resid_std_err": " ",
+    "f_statistic": "",
+}
+
+LATEX_STAT_LABELS = {
+    "n_obs": " Observations\\quad\\quad ",
+    "r2": " R${2}$\\quad\\quad ",
+    "r2_adj": " Adjusted R${2}$\\quad\\quad",
+    "resid_std_err": " Residual Std. Error \\quad\\quad",
+    "f_statistic": " F Statistic\\quad\\quad ",
+}
+
+LATEX_EMPTY_STAT_CELLS = {
+    "n_obs": "&   ",
+    "r2": "&   ",
+    "r2_adj": "&   ",
+    "resid_std_err": "&   ",
+    "f_statistic": "&     ",
+}
+
+
+def snapshot_option(value):
+    """Copy an option value into an immutable value.
+
+    Args:
+        value: value of a rendering option.
+
+    Returns:
+        the value with lists turned into tuples and dicts into read-only
+            copies.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, Mapping):
+        return MappingProxyType(dict(value))
+    return value
+
+
+def thaw_option(value):
+    """Turn an option value of a RenderOptions namedtuple back into an attribute
+    value of a Stargazer, which can be changed without affecting other tables.
 
     Args:
-        models: regression result (or list of results) in dictionary, statsmodels
-            namedtuple format.
-        table_dict (dict): dictionary of arguments analogous to Stargazer
-            attributes.
-        table_type (str): an argument determining the type of table to produce.
-            "html" is for html table, "latex" is for Tex table.
+        value: immutable value of a rendering option.
+
+    Returns:
+        the value with tuples turned into lists and mappings into dicts.
     """
-    table_specs = {}
-    if isinstance(models, list):
-        tables_specs
-    pass
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    return value
+
+
+def validate_model(mod):
+    """Check a model and convert it to the namedtuple format used by Stargazer.
+
+    Args:
+        mod: regression result in dictionary, statsmodels or namedtuple format.
+
+    Returns:
+        namedtuple: model with fields params (pd.DataFrame) and info (dict or
+            LazyInfo).
+    """
+    if hasattr(mod, "params") and hasattr(mod, "info"):
+        assert isinstance(mod.info, Mapping)
+        assert isinstance(mod.params, pd.DataFrame)
+        return mod
+    elif isinstance(mod, dict):
+        return NamedTup(params=mod["params"], info=mod["info"])
+    else:
+        try:
+            # assume its a statsmodels results object and convert it to the
+            # namedtuple we need
+            return NamedTup(
+                params=extract_params_from_sm(mod), info=extract_info_from_sm(mod)
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            raise TypeError("Model {} does not have valid format".format(mod))
+
+
+def compact_model(mod):
+    """Check a model and convert it to a namedtuple that can be pickled.
+
+    Unlike validate_model, the summary statistics are computed and stored in a
+    plain dictionary, so that the namedtuple does not reference the original
+    results object and is small to send to or from another process.
+
+    Args:
+        mod: regression result in dictionary, statsmodels or namedtuple format.
+
+    Returns:
+        NamedTup: model with fields params (pd.DataFrame) and info (dict).
+    """
+    mod_tup = validate_model(mod)
+    return NamedTup(params=mod_tup.params, info=dict(mod_tup.info))
+
+
+def rendered_info_keys(table_dict):
+    """List the keys of the info of a model that a table shows.
+
+    Args:
+        table_dict (dict): options as in Stargazer_table.
+
+    Returns:
+        list: sorted keys of the summary statistics the footer is rendered from.
+    """
+    # the default options, without extracting any models
+    defaults = Stargazer.__new__(Stargazer)
+    defaults.reset_params()
+
+    def option(name):
+        return table_dict.get(name, getattr(defaults, name))
+
+    if not option("show_footer"):
+        return []
+    keys = set()
+    for name, info_keys in FOOTER_INFO_KEYS.items():
+        if option(name):
+            keys.update(info_keys)
+    show_dof = table_dict.get("show_degrees_of_freedom", option("show_dof"))
+    if show_dof and (option("show_residual_std_err") or option("show_f_statistic")):
+        keys.update(["df_model", "df_resid"])
+    return sorted(keys)
+
+
+def Stargazer_table(table_specs, n_jobs=None, cache=None):
+    """Create many html or Tex tables summarizing results of models in parallel.
+
+    Every model is converted to the namedtuple format only once, even if it
+    appears in several tables. Tables rendered in worker processes receive the
+    compact extracted results (see compact_model) instead of the full regression
+    results. With a cache, tables are looked up by hashing only the summary
+    statistics they show, so that e.g. the F-test of statsmodels results is not
+    run for cached tables or tables without the F-statistic.
+
+    Args:
+        table_specs (list): list of TableSpec namedtuples (or tuples in the same
+            order) with the fields:
+            - models: regression result (or list of results) in dictionary,
+              statsmodels or namedtuple format.
+            - table_dict (dict): dictionary of arguments analogous to Stargazer
+              attributes. Keys are names of Stargazer methods, e.g. "title",
+              and values their arguments. Tuples are unpacked into several
+              arguments. Keys that are not methods set the attribute directly.
+            - table_type (str): an argument determining the type of table to
+              produce. "html" is for html table, "latex" is for Tex table.
+            - path (str or pathlib.Path, optional): file the table is written to.
+        n_jobs (int): number of worker processes. None uses all cores, 1 renders
+            the tables in the current process.
+        cache (TableCache, optional): cache of rendered tables. Tables whose
+            models, table_dict and table_type did not change since they were
+            cached are read from it instead of being rendered, and all other
+            tables are stored in it.
+
+    Returns:
+        list: TableResult namedtuples with the fields table (the rendered table,
+            None if it was written to path), path and seconds (the time it took
+            to create the table), in the order of table_specs.
+    """
+    table_specs = [TableSpec(*spec) for spec in table_specs]
+    for spec in table_specs:
+        if spec.table_type not in ["html", "latex"]:
+            raise ValueError(
+                "table_type must be 'html' or 'latex', not {}".format(spec.table_type)
+            )
+    validated = {}
+    fingerprints = {}
+    tasks = []
+    keys = []
+    for spec in table_specs:
+        models = spec.models if isinstance(spec.models, list) else [spec.models]
+        for mod in models:
+            if id(mod) not in validated:
+                validated[id(mod)] = validate_model(mod)
+        tasks.append(spec._replace(models=[validated[id(mod)] for mod in models]))
+        if cache is not None:
+            info_keys = rendered_info_keys(spec.table_dict)
+            for mod in models:
+                if (id(mod), tuple(info_keys)) not in fingerprints:
+                    fingerprints[id(mod), tuple(info_keys)] = fingerprint_model(
+                        validated[id(mod)], info_keys
+                    )
+            keys.append(
+                cache.key(
+                    [fingerprints[id(mod), tuple(info_keys)] for mod in models],
+                    spec.table_dict,
+                    spec.table_type,
+                )
+            )
+
+    results = [None] * len(tasks)
+    if cache is not None:
+        for i, (task, key) in enumerate(zip(tasks, keys)):
+            start = time.perf_counter()
+            table = cache.get(key)
+            if table is not None:
+                results[i] = _finish_table(table, task.path, start)
+    missing = [i for i, result in enumerate(results) if result is None]
+    # tables that are cached are rendered into strings and written afterwards
+    render_tasks = [
+        tasks[i] if cache is None else tasks[i]._replace(path=None) for i in missing
+    ]
+    if n_jobs == 1 or not render_tasks:
+        rendered = [_render_table(task) for task in render_tasks]
+    else:
+        # rebuild user defined namedtuples and lazy info dictionaries so that
+        # they can be pickled
+        compact = {}
+        for i, task in enumerate(render_tasks):
+            for mod in task.models:
+                if id(mod) not in compact:
+                    compact[id(mod)] = compact_model(mod)
+            render_tasks[i] = task._replace(
+                models=[compact[id(mod)] for mod in task.models]
+            )
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            rendered = list(executor.map(_render_table, render_tasks))
+    for i, result in zip(missing, rendered):
+        if cache is not None:
+            cache.put(keys[i], result.table)
+            result = _finish_table(
+                result.table, tasks[i].path, time.perf_counter() - result.seconds
+            )
+        results[i] = result
+    return results
+
+
+def _render_table(spec):
+    """Create and render a single table described by a TableSpec."""
+    start = time.perf_counter()
+    stargazer = Stargazer(spec.models)
+    apply_table_dict(stargazer, spec.table_dict)
+    if spec.table_type == "html":
+        render = stargazer.render_html
+    else:
+        render = stargazer.render_latex
+    if spec.path is None:
+        table = render()
+    else:
+        table = None
+        with open(spec.path, "w") as f:
+            render(stream=f)
+    return TableResult(table, spec.path, time.perf_counter() - start)
+
+
+def apply_table_dict(stargazer, table_dict):
+    """Set the options of a table from a table_dict as in Stargazer_table.
+
+    Args:
+        stargazer (Stargazer): the table.
+        table_dict (dict): keys are names of Stargazer methods, e.g. "title",
+            and values their arguments. Tuples are unpacked into several
+            arguments. Keys that are not methods set the attribute directly.
+    """
+    for key, value in table_dict.items():
+        option = getattr(stargazer, key)
+        if not callable(option):
+            setattr(stargazer, key, value)
+        elif isinstance(value, tuple):
+            option(*value)
+        else:
+            option(value)
+
+
+def _finish_table(table, path, start):
+    """Write a rendered table to path, if given, and return its TableResult."""
+    if path is not None:
+        with open(path, "w") as f:
+            f.write(table)
+        table = None
+    return TableResult(table, path, time.perf_counter() - start)
+
+
+def blank_repeated_labels(index):
+    """Create the labels of the first table columns from a parameter index.
+
+    Args:
+        index (pd.Index or pd.MultiIndex): parameter names in the order of the
+            table rows.
+
+    Returns:
+        list: one np.ndarray of strings per index level, where labels that are
+            the same as in the previous row are replaced by empty strings.
+    """
+    if not isinstance(index, pd.MultiIndex):
+        return [np.asarray(index.astype(str), dtype=object)]
+    columns = []
+    for level, codes in zip(index.levels, index.codes):
+        # code -1 marks a missing label and picks the appended "nan"
+        level_labels = np.append(np.asarray(level.astype(str), dtype=object), "nan")
+        labels = level_labels[codes]
+        labels[1:][codes[1:] == codes[:-1]] = ""
+        columns.append(labels)
+    return columns
+
+
+def _join_or_write(chunks, stream):
+    """Join chunks of a rendered table or write them to a file-like object."""
+    if stream is None:
+        return "".join(chunks)
+    for chunk in chunks:
+        stream.write(chunk)
+
+
+async def _iter_in_executor(chunks, executor=None):
+    """Yield the chunks of a rendered table, producing each in an executor.
+
+    Between two chunks control returns to the event loop, so that it is not
+    blocked by rendering and cancelling the task that consumes the chunks stops
+    the rendering after the current chunk.
+
+    Args:
+        chunks (iterator): chunks of a table, e.g. from Stargazer.iter_html.
+        executor (concurrent.futures.Executor): executor running in threads of
+            the current process. None uses the default executor of the loop.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(executor, next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _markdown_row(cells, widths):
+    """Join the cells of a Markdown table row, padded to the column widths."""
+    cells = [cell.ljust(width) for cell, width in zip(cells, widths)]
+    return "| " + " | ".join(cells) + " |\n"
+
+
+def _escape_markdown_label(label):
+    """Escape characters of a label that have a meaning in Markdown tables."""
+    return label.replace("|", "\\|").replace("*", "\\*")
+
+
+def _ascii_row(cells, widths, ncol):
+    """Join the cells of an ASCII table row: ncol left aligned label columns
+    followed by centered model columns."""
+    cells = [
+        cell.ljust(width) if i < ncol else cell.center(width)
+        for i, (cell, width) in enumerate(zip(cells, widths))
+    ]
+    return ASCII_SEPARATOR.join(cells).rstrip() + "\n"
+
+
+def _ascii_table_width(widths):
+    """Compute the width of an ASCII table from the widths of its columns."""
+    return int(sum(widths)) + len(ASCII_SEPARATOR) * (len(widths) - 1)
+
+
+ASCII_SEPARATOR = "   "
+
+ASCII_STAT_LABELS = {
+    "n_obs": "Observations",
+    "r2": "R2",
+    "r2_adj": "Adjusted R2",
+    "resid_std_err": "Residual Std. Error",
+    "f_statistic": "F Statistic",
+}
+
+
 class Stargazer:
     """
     Class that is constructed with one or more trained
@@ -71,16 +617,104 @@ class Stargazer:
     The user then can change the rendering options by
     chaining different methods to the Stargazer object
     and then render the results in either HTML or LaTeX.
+
+    The parameters of all models are shown in sorted order, or with
+    param_order="first_seen" in the order in which they first appear
+    in the models.
+
+    With slim=True only the compact extracted arrays and summary
+    statistics are kept after extraction, and no reference to the
+    models (e.g. fitted statsmodels results and their design
+    matrices) is retained. See drop_models.
+
+    Rendering is thread-safe. Every render takes a snapshot of the
+    options (see render_options) and builds the table only from this
+    snapshot and the extracted data. The aligned parameter arrays are
+    not modified after extraction. Summary statistics are computed
+    lazily when a render first shows them and memoized in the LazyInfo
+    of their model, which computes every value once under a lock. The
+    only other state a render writes is the cache of layout parts and
+    rendered fragments, whose entries are replaced but never changed.
+    Any number of threads can therefore render the same Stargazer, or
+    views of it, concurrently. Changing options is not synchronized
+    with renders in other threads: to render variants concurrently,
+    give every thread its own view made with with_options, which is
+    cheap.
+
+    Timings are opt-in: if hooks (a list of callables, possibly empty)
+    is given, the wall time of validate_input, of extract_model_data
+    for every model and of the layout, header, body chunks, footer and
+    notes of every HTML or LaTeX render is measured together with the
+    size of the rendered pieces. Every hook is called with a StageStats
+    namedtuple as soon as a stage is finished. The StageStats of the
+    extraction are kept in extract_stats and those of the latest render
+    in last_render_stats. Renders in several threads each record their
+    own list, of which last_render_stats is the one started last.
+
+    Models are validated one after another, unless n_jobs is not 1 or an
+    executor (e.g. a concurrent.futures.ThreadPoolExecutor) is given:
+    then they are validated concurrently in n_jobs threads (None uses
+    the default number of threads of ThreadPoolExecutor) or by the
+    executor, which is worthwhile for statsmodels results whose standard
+    errors or confidence intervals take long to compute. The models are
+    always extracted in the order they are passed. With a
+    ProcessPoolExecutor, the summary statistics are computed in the
+    worker processes as well, see compact_model.
     """
 
-    def __init__(self, models):
+    def __init__(
+        self,
+        models,
+        slim=False,
+        param_order="sorted",
+        hooks=None,
+        n_jobs=1,
+        executor=None,
+    ):
+        if param_order not in ["sorted", "first_seen"]:
+            raise ValueError(
+                "param_order must be 'sorted' or 'first_seen', not {}".format(
+                    param_order
+                )
+            )
+        self.param_order = param_order
         if isinstance(models, list):
-            self.models = models
+            self.models = list(models)
         else:
             self.models = [models]
         self.num_models = len(self.models)
+        self.hooks = None if hooks is None else list(hooks)
+        self.last_render_stats = None
+        self.n_jobs = n_jobs
+        self.executor = executor
         self.reset_params()
         self.extract_data()
+        if slim:
+            self.drop_models()
+
+    @classmethod
+    async def create_async(cls, models, executor=None, **kwargs):
+        """
+        Create a table without blocking the event loop: the data of the
+        models is extracted in executor (a thread pool; None uses the
+        default executor of the event loop). kwargs are passed on to
+        Stargazer, e.g. n_jobs.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(cls, models, **kwargs))
+
+    def drop_models(self):
+        """
+        Free everything but the aligned parameter arrays and the summary
+        statistics of the models.
+
+        Lazily computed statistics are computed now, because the models
+        they are computed from are dropped.
+        """
+        self.models = None
+        self.model_data = [
+            {key: md[key] for key in MODEL_STAT_KEYS} for md in self.model_data
+        ]
 
     def validate_input(self):
         """
@@ -89,25 +723,18 @@ class Stargazer:
 
         Any future checking will be added here.
         """
-        for i, mod in enumerate(self.models):
-            if hasattr(mod, "params") and hasattr(mod, "info"):
-                assert isinstance(mod.info, dict)
-                assert isinstance(mod.params, pd.DataFrame)
-            elif isinstance(mod, dict):
-                NamedTup = namedtuple("NamedTup", "params info")
-                self.models[i] = NamedTup(params=mod["params"], info=mod["info"])
-            else:
-                try:
-                    NamedTup = namedtuple("NamedTup", "params info")
-                    self.models[i] = NamedTup(
-                        params=extract_params_from_sm(mod),
-                        info={**extract_info_from_sm(mod)},
-                    )
-                # assume its a statsmodels results object and convert it to the namedtuple we need
-                except (KeyboardInterrupt, SystemExit):
-                    raise
-                except:
-                    raise TypeError("Model {} does not have valid format".format(mod))
+        if self.executor is not None:
+            worker = validate_model
+            if isinstance(self.executor, ProcessPoolExecutor):
+                # lazy statistics would reference the results objects
+                worker = compact_model
+            self.models = list(self.executor.map(worker, self.models))
+        elif self.n_jobs != 1:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                self.models = list(executor.map(validate_model, self.models))
+        else:
+            for i, mod in enumerate(self.models):
+                self.models[i] = validate_model(mod)
 
     def reset_params(self):
         """
@@ -145,85 +772,455 @@ class Stargazer:
         self.notes_append = True
         self.custom_notes = []
 
+    def render_options(self):
+        """
+        Return a snapshot of the current rendering options as an immutable
+        RenderOptions namedtuple.
+        """
+        return RenderOptions(
+            *[snapshot_option(getattr(self, name)) for name in RenderOptions._fields]
+        )
+
+    def with_options(self, **options):
+        """
+        Return a view of the table with some rendering options changed.
+        The options are passed as keyword arguments named as the fields
+        of RenderOptions, e.g. with_options(confidence_intervals=True).
+
+        The view is a Stargazer that shares the extracted model data and
+        the cached layout parts and fragments that do not depend on the
+        changed options with this table, so it is created without any
+        extraction. Changing the options of the view afterwards does not
+        affect this table and vice versa.
+        """
+        unknown = set(options).difference(RenderOptions._fields)
+        if unknown:
+            raise TypeError("Unknown rendering options: {}".format(sorted(unknown)))
+        view = copy.copy(self)
+        view.param_names = list(self.param_names)
+        if self.models is not None:
+            view.models = list(self.models)
+        view._render_cache = dict(self._render_cache)
+        view.apply_options(self.render_options()._replace(**options))
+        return view
+
+    def apply_options(self, options):
+        """
+        Set all rendering options from a RenderOptions namedtuple.
+
+        The parameter order may contain any extracted parameters, also
+        ones that an earlier covariate_order left out.
+        """
+        for name, value in zip(options._fields, options):
+            if name != "param_names":
+                setattr(self, name, thaw_option(value))
+        param_names = list(options.param_names)
+        if param_names != list(self.param_names):
+            missing = set(param_names).difference(self.param_positions)
+            assert not missing, (
+                "Parameter order must contain subset of existing "
+                "parameters: {} are not.".format(missing)
+            )
+            self.original_param_names = self.param_names
+            self.param_names = param_names
+
     def extract_data(self):
         """
         Extract the values we need from the models and store
         for use or modification. They should not be able to
         be modified by any rendering parameters.
         """
+        stats = None if self.hooks is None else []
+        start = time.perf_counter()
         self.validate_input()
+        self.record_stage(stats, "validate_input", None, 0, start)
         self.model_data = []
-        for m in self.models:
+        for j, m in enumerate(self.models):
+            start = time.perf_counter()
             self.model_data.append(self.extract_model_data(m))
+            self.record_stage(stats, "extract_model_data", None, j, start)
+        self.extract_stats = stats
+
+        # union of all parameter names, in the order they first appear
+        indices = [md["param_values"].index for md in self.model_data]
+        union = indices[0].append(indices[1:]).unique()
+        if self.param_order == "sorted":
+            union = union.sort_values()
+        self.set_param_index(union)
+        self.align_model_data()
+        self.clear_render_cache()
+
+    def set_param_index(self, index):
+        """
+        Set the union of the parameter names of all models, in the order
+        of the table rows, from which the rows are looked up.
+        """
+        self.param_index = index
+        self.param_names = list(index)
+        self.param_positions = {name: i for i, name in enumerate(self.param_names)}
+
+    def save_extracted(self, path, compressed=False):
+        """
+        Write the extracted model data into an .npz file, from which
+        load_extracted creates the table again without the models. See
+        extracted.save_extracted for the arguments.
+
+        Lazily computed statistics of the models are computed now.
+        """
+        data = ExtractedData(
+            param_index=self.param_index,
+            aligned_data=self.aligned_data,
+            model_data=[
+                {key: md[key] for key in MODEL_STAT_KEYS} for md in self.model_data
+            ],
+            param_order=self.param_order,
+        )
+        save_extracted(path, data, compressed)
+
+    @classmethod
+    def load_extracted(cls, path, hooks=None):
+        """
+        Create a table from an .npz file written by save_extracted. The
+        table has default rendering options and is slim (see
+        drop_models), because no models are loaded.
+        """
+        start = time.perf_counter()
+        data = read_extracted(path)
+        self = cls.__new__(cls)
+        self.param_order = data.param_order
+        self.models = None
+        self.num_models = len(data.model_data)
+        self.hooks = None if hooks is None else list(hooks)
+        self.last_render_stats = None
+        self.n_jobs = 1
+        self.executor = None
+        self.reset_params()
+        self.model_data = data.model_data
+        self.set_param_index(data.param_index)
+        self.aligned_data = data.aligned_data
+        self.clear_render_cache()
+        self.extract_stats = None if self.hooks is None else []
+        self.record_stage(self.extract_stats, "load_extracted", None, 0, start)
+        return self
+
+    def align_model_data(self):
+        """
+        Stack the estimates of all models into dense arrays of shape
+        (number of parameters, number of models) that are aligned with
+        the union of parameter names. Renderers look up cells in these
+        arrays by integer position instead of searching every model.
+        """
+        value_keys = [
+            "param_values",
+            "param_std_err",
+            "p_values",
+            "ci_lower",
+            "ci_upper",
+        ]
+        shape = (len(self.param_names), self.num_models)
+        index = self.param_index
+        self.aligned_data = {"present": np.zeros(shape, dtype=bool)}
+        for key in value_keys:
+            self.aligned_data[key] = np.full(shape, np.nan)
+        for j, md in enumerate(self.model_data):
+            rows = index.get_indexer(md["param_values"].index)
+            self.aligned_data["present"][rows, j] = True
+            for key in value_keys:
+                self.aligned_data[key][rows, j] = md[key].to_numpy(dtype=float)
+
+    def option_state(self, *parts, options=None):
+        """
+        Return the values of the options that the given parts of the
+        layout (by default all parts) depend on as a hashable tuple,
+        taken from options (by default the current options).
+        """
+        if options is None:
+            options = self.render_options()
+        parts = parts or list(LAYOUT_OPTIONS)
+        return tuple(
+            freeze_option(getattr(options, name))
+            for part in parts
+            for name in LAYOUT_OPTIONS[part]
+        )
+
+    def cached(self, key, parts, build, options=None):
+        """
+        Return the layout part or rendered fragment cached under key. It
+        is built by calling build if it is not cached yet or if one of
+        the options of the given layout parts changed since, so that e.g.
+        a new title only rebuilds the header.
+
+        Entries are replaced but never changed, so that threads rendering
+        concurrently only ever see complete entries.
+        """
+        state = self.option_state(*parts, options=options)
+        entry = self._render_cache.get(key)
+        if entry is None or entry[0] != state:
+            entry = (state, build())
+            self._render_cache[key] = entry
+        return entry[1]
+
+    def clear_render_cache(self):
+        """
+        Drop the cached layout and rendered fragments, e.g. to free the
+        memory they take for large tables.
+        """
+        self._render_cache = {}
+
+    def cached_chunks(self, key, parts, generate, options=None):
+        """
+        Yield the chunks of the rendered fragment cached under key. If it
+        is not cached yet or one of the options of the given layout parts
+        changed since (see cached), the chunks are yielded as they are
+        generated by calling generate and cached once all are generated.
+        """
+        state = self.option_state(*parts, options=options)
+        entry = self._render_cache.get(key)
+        if entry is not None and entry[0] == state:
+            yield from entry[1]
+            return
+        chunks = []
+        for chunk in generate():
+            chunks.append(chunk)
+            yield chunk
+        self._render_cache[key] = (state, chunks)
+
+    def iter_fragments(self, table_type, fragments, options, cache_body=False):
+        """
+        Yield the chunks of the fragments of a table for a RenderOptions
+        snapshot. fragments is a function that returns the fragments for
+        the layout as a list of (stage, key, parts, generate) tuples, see
+        cached_chunks, where fragments with key None are not cached. With
+        hooks, the StageStats of the layout and of every chunk of every
+        stage are recorded in last_render_stats. cache_body is passed to
+        table_layout.
+        """
+        stats = None
+        if self.hooks is not None:
+            stats = []
+            self.last_render_stats = stats
+        start = time.perf_counter()
+        layout = self.table_layout(options, cache_body)
+        self.record_stage(stats, "layout", table_type, 0, start)
+        for stage, key, parts, generate in fragments(layout):
+            if key is None:
+                chunks = iter(generate())
+            else:
+                chunks = iter(self.cached_chunks(key, parts, generate, options))
+            chunk_number = 0
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                self.record_stage(stats, stage, table_type, chunk_number, start, chunk)
+                chunk_number += 1
+                yield chunk
+
+    def record_stage(self, stats, stage, table_type, chunk, start, output=None):
+        """
+        Append the StageStats of a stage that started at start (a value
+        of time.perf_counter) to stats and pass them to the hooks. Does
+        nothing if stats is None, i.e. if timings are not recorded.
+        """
+        if stats is None:
+            return
+        n_bytes = None if output is None else len(output.encode("utf-8"))
+        stage_stats = StageStats(
+            stage, table_type, chunk, time.perf_counter() - start, n_bytes
+        )
+        stats.append(stage_stats)
+        for hook in self.hooks:
+            hook(stage_stats)
 
-        pars = []
-        for md in self.model_data:
-            pars = pars + list(md["param_names"])
-        self.param_names = sorted(set(pars))
-        nlevels = self.models[0].params.index.nlevels
-        # generate the first coluimn of table
-        metalist = [[] for i in range(nlevels)]
-        # ith list in the list is the ith index level value
-        for i in range(nlevels):
-            for p in self.param_names:
-                if isinstance(pars[0], tuple):
-                    metalist[i].append(p[i])
-                else:
-                    metalist[i].append(p)
-        # the below list contains lists of indices where repeated
-        # subsequent values are replaced by emppty string
-        ulist = [[] for i in range(nlevels)]
-        for i, l in enumerate(metalist):
-            for j, n in enumerate(l):
-                if j == 0:
-                    ulist[i].append(str(n))
-                elif j > 0:
-                    if l[j] == l[j - 1]:
-                        ulist[i].append("")
-                    else:
-                        ulist[i].append(str(n))
-        df = pd.DataFrame(ulist).transpose()
-        if isinstance(pars[0], tuple):
-            df.index = pd.MultiIndex.from_tuples(self.param_names)
+    def table_layout(self, options=None, cache_body=False):
+        """
+        Return the renderer independent layout of the table (see the
+        layout module) for a RenderOptions snapshot (by default the
+        current options). Each part of it is built once per state of the
+        options it depends on and shared by all renderers.
+
+        With cache_body, the formatted cells of the body are cached too
+        (see body_cells), which renders that return the whole table do.
+        Streaming renders format them chunk by chunk without keeping them.
+        """
+        if options is None:
+            options = self.render_options()
+
+        def part(name, build):
+            return self.cached(name, [name], partial(build, self, options), options)
+
+        return TableLayout(
+            num_label_columns=self.param_index.nlevels,
+            num_models=self.num_models,
+            show_header=options.show_header,
+            title=options.title_text,
+            header=part("header", build_header),
+            body=part("body", build_body),
+            footer=part("footer", build_footer),
+            notes=part("notes", build_notes),
+            options=options,
+            cache_body=cache_body,
+        )
+
+    def f_statistic_icons(self, options=None):
+        """
+        Compute the significance stars of the F-statistics of all models.
+
+        They are computed only when the F-statistic is shown, because
+        the F-test of some models is expensive.
+        """
+        if options is None:
+            options = self.render_options()
+        return significance_stars(self.model_stat("f_p_value"), options.sig_levels)
+
+    def format_param_cells(self, positions=None, options=None, models=None):
+        """
+        Format the aligned parameter arrays according to the rendering
+        options (by default the current options). Returns a dictionary
+        with string arrays of parameter values and of their precision
+        (standard errors or confidence intervals).
+
+        If positions is given, only these rows of the aligned arrays
+        are formatted, and if models is given only these columns.
+        """
+        if positions is None:
+            positions = slice(None)
+        if models is None:
+            models = slice(None)
+        if options is None:
+            options = self.render_options()
+        digits = options.sig_digits
+
+        def aligned(key):
+            return self.aligned_data[key][positions][:, models]
+
+        cells = {}
+        cells["param_values"] = format_numbers(aligned("param_values"), digits)
+        if options.confidence_intervals:
+            cells["precision"] = format_intervals(
+                aligned("ci_lower"), aligned("ci_upper"), digits
+            )
         else:
-            df.index = self.param_names
+            cells["precision"] = format_numbers(aligned("param_std_err"), digits)
+        return cells
+
+    def body_cells(self, layout, rows, models=None):
+        """
+        Return the formatted cells (BodyCells) of the rows of the body
+        selected by rows (a slice), for all models or the positions in
+        models, see format_body.
 
-        self.first_table_col = df
+        If the layout caches the body, the cells of all models are
+        formatted once per slice of rows and state of the options they
+        depend on, and shared by all formats.
+        """
+        if not layout.cache_body:
+            return format_body(self, layout, rows, models)
+        cells = self.cached(
+            ("cells", rows.start, rows.stop),
+            ["cells"],
+            partial(format_body, self, layout, rows),
+            layout.options,
+        )
+        # the labels also depend on param_nicer_names
+        cells = cells._replace(labels=layout.body.labels[rows])
+        return cells if models is None else select_models(cells, models)
+
+    def row_labels(self, param_names):
+        """
+        Compute the labels of the first table columns for the rows of the
+        parameters in param_names as an object array with one row per
+        parameter, where outer levels repeating the previous row are
+        blank. Renderers take the labels of a row by its integer position.
+        """
+        positions = [self.param_positions[p] for p in param_names]
+        index = self.param_index[positions]
+        columns = blank_repeated_labels(index)
+        # the innermost level is never blank and is renamed when formatted
+        columns[-1] = np.asarray(index.get_level_values(-1), dtype=object)
+        return np.column_stack(columns)
+
+    def format_stat_rows(self, options=None):
+        """
+        Format the model summary statistics shown in the footer according
+        to the rendering options (by default the current options). Returns
+        a list of StatRow namedtuples with the name of the statistic, the
+        formatted values, the significance stars (None if the statistic has
+        none) and suffixes such as degrees of freedom, one per model.
+        """
+        if options is None:
+            options = self.render_options()
+        digits = options.sig_digits
+        rows = []
+        if options.show_n:
+            values = [
+                "" if np.isnan(md["n_obs"]) else str(md["n_obs"])
+                for md in self.model_data
+            ]
+            rows.append(StatRow("n_obs", values, None, [""] * self.num_models))
+        if options.show_r2:
+            for stat in ["r2", "r2_adj"]:
+                values = format_numbers(self.model_stat(stat), digits)
+                rows.append(StatRow(stat, values, None, [""] * self.num_models))
+        if options.show_residual_std_err:
+            values = format_numbers(self.model_stat("resid_std_err"), digits)
+            suffixes = [""] * self.num_models
+            if options.show_dof:
+                dfr = format_numbers(self.model_stat("degree_freedom_resid"), 0)
+                suffixes = [
+                    "(df = " + d + ")" if v and d else "" for v, d in zip(values, dfr)
+                ]
+            rows.append(StatRow("resid_std_err", values, None, suffixes))
+        if options.show_f_statistic:
+            values = format_numbers(self.model_stat("f_statistic"), digits)
+            stars = [
+                icon if v else ""
+                for v, icon in zip(values, self.f_statistic_icons(options))
+            ]
+            suffixes = [""] * self.num_models
+            if options.show_dof:
+                for j, md in enumerate(self.model_data):
+                    df = [md["degree_freedom"], md["degree_freedom_resid"]]
+                    if values[j] and not np.isnan(df).all():
+                        df = ["" if np.isnan(d) else str(d) for d in df]
+                        suffixes[j] = "(df = " + "; ".join(df) + ")"
+            rows.append(StatRow("f_statistic", values, stars, suffixes))
+        return rows
+
+    def model_stat(self, key):
+        """
+        Collect a summary statistic of all models into an array.
+        """
+        return np.array([md[key] for md in self.model_data], dtype=float)
 
     def extract_model_data(self, model):  # assume model is namedtuple
-        data = {}
-        data["param_names"] = model.params.index.values
+        # summary statistics are only read from info when a renderer needs them
+        info = model.info
+        data = LazyInfo(
+            {
+                "r2": lambda: info.get("rsquared", np.nan),
+                "r2_adj": lambda: info.get("rsquared_adj", np.nan),
+                "resid_std_err": lambda: np.sqrt(info.get("scale", np.nan)),
+                "f_statistic": lambda: info.get("fvalue", np.nan),
+                "f_p_value": lambda: info.get("f_pvalue", np.nan),
+                "degree_freedom": lambda: info.get("df_model", np.nan),
+                "degree_freedom_resid": lambda: info.get("df_resid", np.nan),
+                "n_obs": lambda: (
+                    info["n_obs"]
+                    if "n_obs" in info
+                    else data["degree_freedom"] + data["degree_freedom_resid"] + 1
+                ),
+                "dependent_variable": lambda: info.get("dependent_variable", np.nan),
+                # building tuples of a MultiIndex is slow and rarely needed
+                "param_names": lambda: model.params.index.values,
+            }
+        )
         data["param_values"] = model.params.value
         data["p_values"] = model.params.pvalue
         data["param_std_err"] = model.params.standard_error
         data["ci_lower"] = model.params.ci_lower
         data["ci_upper"] = model.params.ci_upper
-        data["r2"] = model.info.get("rsquared", np.nan)
-        data["r2_adj"] = model.info.get("rsquared_adj", np.nan)
-        data["resid_std_err"] = np.sqrt(model.info.get("scale", np.nan))
-        data["f_statistic"] = model.info.get("fvalue", np.nan)
-        data["f_p_value"] = model.info.get("f_pvalue", np.nan)
-        data["degree_freedom"] = model.info.get("df_model", np.nan)
-        data["degree_freedom_resid"] = model.info.get("df_resid", np.nan)
-        data["n_obs"] = model.info.get(
-            "n_obs", data["degree_freedom"] + data["degree_freedom_resid"] + 1
-        )
-        data["dependent_variable"] = model.info.get("dependent_variable", np.nan)
-        # generate significance icons
-        sig_bins = [-1] + sorted(self.sig_levels) + [2]
-        data["sig_icons"] = pd.cut(
-            data["p_values"],
-            bins=sig_bins,
-            labels=[
-                "*" * (len(self.sig_levels) - i)
-                for i in range(len(self.sig_levels) + 1)
-            ],
-        )
-        data["sig_icon_fstat"] = (
-            "*"
-            * (1 - np.isnan(data["f_p_value"]))
-            * (len(self.sig_levels) - np.digitize(data["f_p_value"], sig_bins) + 1)
-        )
         return data
 
     # Begin render option functions
@@ -266,22 +1263,6 @@ class Stargazer:
             sum([int(type(l) != float) for l in levels]) == 0
         ), "Please input floating point values as significance levels"
         self.sig_levels = sorted(levels, reverse=True)
-        # Redefine the significance stars
-        sig_bins = [-1] + sorted(self.sig_levels) + [2]
-        for md in self.model_data:
-            md["sig_icons"] = pd.cut(
-                md["p_values"],
-                bins=sig_bins,
-                labels=[
-                    "*" * (len(self.sig_levels) - i)
-                    for i in range(len(self.sig_levels) + 1)
-                ],
-            )
-            md["sig_icon_fstat"] = (
-                "*"
-                * (1 - np.isnan(md["f_p_value"]))
-                * (len(self.sig_levels) - np.digitize(md["f_p_value"], sig_bins) + 1)
-            )
 
     def significant_digits(self, digits):
         assert type(digits) == int, "The number of significant digits must be an int"
@@ -334,365 +1315,269 @@ class Stargazer:
         self.notes_append = append
 
     # Begin HTML render functions
-    def render_html(self):
-        html = ""
-        html += self.generate_header_html()
-        html += self.generate_body_html()
-        html += self.generate_footer_html()
+    def render_html(self, stream=None):
+        """
+        Render the table in HTML.
 
-        return html
+        If stream is given, the table is written chunk by chunk to this
+        file-like object instead of being returned as a string.
+        """
+        return _join_or_write(self.iter_html(cache_body=stream is None), stream)
 
-    def generate_header_html(self):
+    async def render_html_async(self, chunk_size=100, executor=None):
+        """
+        Render the table in HTML without blocking the event loop. The
+        table is rendered in executor, see aiter_html.
+        """
+        chunks = self.aiter_html(chunk_size, executor, cache_body=True)
+        return "".join([chunk async for chunk in chunks])
+
+    def aiter_html(self, chunk_size=100, executor=None, cache_body=False):
+        """
+        Asynchronously iterate over the pieces of iter_html. Every piece
+        is rendered in executor (a thread pool; None uses the default
+        executor of the event loop) and cancelling the task iterating
+        stops the rendering after the current piece. The first piece
+        also builds the layout of the table, unless it is cached.
+        """
+        return _iter_in_executor(self.iter_html(chunk_size, cache_body), executor)
+
+    def iter_html(self, chunk_size=100, cache_body=False):
+        """
+        Yield the HTML table in pieces: the header, the body in
+        chunks of chunk_size parameters, the footer and the notes.
+
+        The header, footer and notes are cached and only rendered again
+        when an option they depend on changes. By default the body is
+        formatted and rendered chunk by chunk on every call and not kept,
+        so that streaming a large table only holds one chunk at a time.
+        With cache_body, its formatted cells (see table_layout) and its
+        rendered chunks are cached as well.
+        """
+        return self.iter_fragments(
+            "html",
+            lambda layout: [
+                (
+                    "header",
+                    ("html", "header"),
+                    ["header"],
+                    lambda: [self.generate_header_html(layout)],
+                ),
+                (
+                    "body",
+                    ("html", "body", chunk_size) if layout.cache_body else None,
+                    ["body", "cells"],
+                    partial(self.iter_body_html, chunk_size, layout),
+                ),
+                (
+                    "footer",
+                    ("html", "footer"),
+                    ["footer"],
+                    lambda: [self.generate_summary_html(layout)],
+                ),
+                (
+                    "notes",
+                    ("html", "notes"),
+                    ["footer", "notes"],
+                    lambda: [self.generate_table_end_html(layout)],
+                ),
+            ],
+            self.render_options(),
+            cache_body,
+        )
+
+    def render_html_template(self, template_name="stargazer.html", template_dir=None):
+        """
+        Render the table in HTML with a Jinja2 template. See
+        template_renderer.render_template for the arguments.
+        """
+        from .template_renderer import render_template
+
+        return render_template(self, template_name, template_dir)
+
+    def generate_header_html(self, layout=None):
+        if layout is None:
+            layout = self.table_layout()
         header = ""
-        if not self.show_header:
+        if not layout.show_header:
             return header
+        ncol = layout.num_label_columns
+        num_columns = layout.num_models + ncol
+        label_padding = ""
+        if ncol > 1:
+            label_padding = '<td colspan="' + str(ncol - 1) + '">' + "</td>"
 
-        if self.title_text is not None:
-            header += self.title_text + "<br>"
+        if layout.title is not None:
+            header += layout.title + "<br>"
 
         header += '<table style="text-align:center"><tr><td colspan="'
         header += (
-            str(self.num_models + len(self.first_table_col.columns))
-            + '" style="border-bottom: 1px solid black"></td></tr>'
+            str(num_columns) + '" style="border-bottom: 1px solid black"></td></tr>'
         )
-        if self.model_name is not None:
+        rows = {row.kind: row.cells for row in layout.header}
+        if "model_name" in rows:
             header += '<tr><td style="text-align:left"></td><td colspan="' + str(
-                self.num_models + len(self.first_table_col.columns) - 1
+                num_columns - 1
             )
-            header += '"><em>' + self.model_name + "</em></td></tr>"
+            header += '"><em>' + rows["model_name"][0].text + "</em></td></tr>"
 
         header += '<tr><td style="text-align:left"></td>'
 
-        if self.column_labels is not None:
-            if type(self.column_labels) == str:
-                if len(self.first_table_col.columns) > 1:
-                    header += (
-                        '<td colspan="'
-                        + str(len(self.first_table_col.columns) - 1)
-                        + '">'
-                        + " </td>"
-                    )
-                header += '<td colspan="' + str(self.num_models) + '">'
-                header += self.column_labels + "</td></tr>"
+        if "column_labels" in rows:
+            cells = rows["column_labels"]
+            if cells[0].style == "center":
+                if ncol > 1:
+                    header += '<td colspan="' + str(ncol - 1) + '">' + " </td>"
+                header += '<td colspan="' + str(cells[0].span) + '">'
+                header += cells[0].text + "</td></tr>"
             else:
                 # The first table column holds the covariates names:
-                header += "<tr><td></td>"
-                if len(self.first_table_col.columns) > 1:
-                    header += (
-                        '<td colspan="'
-                        + str(len(self.first_table_col.columns) - 1)
-                        + '">'
-                        + "</td>"
-                    )
-                for i, label in enumerate(self.column_labels):
-                    sep = self.column_separators[i]
-                    header += '<td colspan="{}">{}</td>'.format(sep, label)
+                header += "<tr><td></td>" + label_padding
+                for cell in cells:
+                    header += '<td colspan="{}">{}</td>'.format(cell.span, cell.text)
                 header += "</tr>"
 
-        if self.show_model_nums:
-            header += '<tr><td style="text-align:left"></td>'
-            if len(self.first_table_col.columns) > 1:
-                header += (
-                    '<td colspan="'
-                    + str(len(self.first_table_col.columns) - 1)
-                    + '">'
-                    + "</td>"
-                )
-            for num in range(1, self.num_models + 1):
-                header += "<td>(" + str(num) + ")</td>"
+        if "model_numbers" in rows:
+            header += '<tr><td style="text-align:left"></td>' + label_padding
+            for cell in rows["model_numbers"]:
+                header += "<td>" + cell.text + "</td>"
             header += "</tr>"
-        if len(self.first_table_col.columns) > 1:
-            header += '<tr><td colspan="' + str(
-                self.num_models + len(self.first_table_col.columns) + 1
-            )
+        if ncol > 1:
+            header += '<tr><td colspan="' + str(num_columns + 1)
         else:
-            header += '<tr><td colspan="' + str(self.num_models + 1)
+            header += '<tr><td colspan="' + str(layout.num_models + 1)
         header += '" style="border-bottom: 1px solid black"></td></tr>'
 
         return header
 
-    def generate_body_html(self):
+    def generate_body_html(self, layout=None):
         """
         Generate the body of the results where the
         covariate reporting is.
         """
-        body = ""
-        for param_name in self.param_names:
-            body += self.generate_param_rows_html(param_name)
-
-        return body
-
-    def generate_param_rows_html(self, param_name):
-        param_text = ""
-        param_text += self.generate_param_main_html(param_name)
-        if self.show_precision:
-            param_text += self.generate_param_precision_html(param_name)
-        else:
-            param_text += "<tr></tr>"
+        return "".join(self.iter_body_html(layout=layout))
 
-        return param_text
+    def iter_body_html(self, chunk_size=100, layout=None):
+        if layout is None:
+            layout = self.table_layout()
+        for rows in row_slices(len(layout.body.positions), chunk_size):
+            yield self.generate_param_rows_html(layout, rows)
 
-    def generate_param_main_html(self, param_name):
-        # param_name is unique
-        # names
-        if isinstance(param_name, tuple):
-            param_print_name = param_name[-1]
-        else:
-            param_print_name = param_name
-        if self.param_nicer_names is not None:
-            param_print_name = self.param_nicer_names.get(
-                param_print_name, param_print_name
-            )
-        param_text = "<tr>"
-        if not isinstance(param_name, tuple):
-            param_text += (
-                '<td style="text-align:left">' + param_print_name + "&nbsp;</td>"
-            )
-        else:
-            for i in range(len(param_name) - 1):
-                param_text += (
-                    '<td style="text-align:left">'
-                    + str(self.first_table_col.loc[param_name][i])
-                    + "&nbsp;</td>"
+    def generate_param_rows_html(self, layout, rows):
+        """
+        Generate the main and precision rows of the parameters selected
+        by rows (a slice of the table body).
+        """
+        body = self.body_cells(layout, rows)
+        present = body.present
+        labels = '<td style="text-align:left">' + body.labels + "&nbsp;</td>"
+        main = "<td>" + body.values
+        if body.stars is not None:
+            main = main + "<sup>" + body.stars + "</sup>"
+        main = np.where(present, main + "</td>", "<td></td>")
+        param_text = "<tr>" + join_columns(labels) + join_columns(main) + "</tr>"
+        if body.precision is not None:
+            padding = '<tr><td style="text-align:left"></td>'
+            if layout.num_label_columns > 1:
+                padding += (
+                    '<td colspan="' + str(layout.num_label_columns - 1) + '">' + "</td>"
                 )
-            param_text += (
-                '<td style="text-align:left">' + param_print_name + "&nbsp;</td>"
+            precision = np.where(
+                present, "<td>&nbsp;(" + body.precision + ")</td>", "<td></td>"
             )
-        # values
-        for md in self.model_data:
-            if param_name in list(md["param_names"]):
-                param_text += "<td>"
-                param_text += str(
-                    np.round(md["param_values"][param_name], self.sig_digits)
-                )
-                if self.show_sig:
-                    param_text += "<sup>" + str(md["sig_icons"][param_name]) + "</sup>"
-                param_text += "</td>"
-            else:
-                param_text += "<td></td>"
-        param_text += "</tr>"
-
-        return param_text
-
-    def generate_param_precision_html(self, param_name):
-
-        param_text = '<tr><td style="text-align:left"></td>'
-        if isinstance(param_name, tuple):
-            param_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
-            )
-        for md in self.model_data:
-            if param_name in list(md["param_names"]):
-                param_text += "<td>&nbsp;("
-                if self.confidence_intervals:
-                    param_text += (
-                        str(np.round(md["ci_lower"][param_name], self.sig_digits)) + " , "
-                    )
-                    param_text += str(
-                        np.round(md["ci_upper"][param_name], self.sig_digits)
-                    )
-                else:
-                    param_text += str(
-                        np.round(md["param_std_err"][param_name], self.sig_digits)
-                    )
-                param_text += ")</td>"
-            else:
-                param_text += "<td></td>"
-        param_text += "</tr>"
+            param_text = param_text + padding + join_columns(precision) + "</tr>"
+        else:
+            param_text = param_text + "<tr></tr>"
 
-        return param_text
+        return "".join(param_text)
 
-    def generate_footer_html(self):
+    def generate_footer_html(self, layout=None):
         """
         Generate the footer of the table where
         model summary section is.
         """
-        footer = (
+        if layout is None:
+            layout = self.table_layout()
+        return self.generate_summary_html(layout) + self.generate_table_end_html(layout)
+
+    def generate_summary_html(self, layout):
+        """
+        Generate the model summary rows of the footer between its rules.
+        """
+        num_columns = layout.num_models + layout.num_label_columns
+        rule = (
             '<td colspan="'
-            + str(self.num_models + len(self.first_table_col.columns))
+            + str(num_columns)
             + '" style="border-bottom: 1px solid black"></td></tr>'
         )
+        summary = rule
+        if layout.footer is None:
+            return summary
+        for row in layout.footer:
+            summary += self.generate_stat_row_html(layout, row)
+        return summary + "<tr>" + rule
+
+    def generate_table_end_html(self, layout):
+        """
+        Generate the notes and close the table, unless the footer is hidden.
+        """
+        if layout.footer is None:
+            return ""
+        return self.generate_notes_html(layout) + "</table>"
 
-        if not self.show_footer:
-            return footer
-        footer += self.generate_observations_html()
-        footer += self.generate_r2_html()
-        footer += self.generate_r2_adj_html()
-        if self.show_residual_std_err:
-            footer += self.generate_resid_std_err_html()
-        if self.show_f_statistic:
-            footer += self.generate_f_statistic_html()
-        footer += (
-            '<tr><td colspan="'
-            + str(self.num_models + len(self.first_table_col.columns))
-            + '" style="border-bottom: 1px solid black"></td></tr>'
+    def generate_stat_row_html(self, layout, row):
+        """
+        Generate the row of a model summary statistic from a StatRow.
+        """
+        stat_text = (
+            '<tr><td style="text-align: left">' + HTML_STAT_LABELS[row.stat] + "</td>"
         )
-        footer += self.generate_notes_html()
-        footer += "</table>"
-
-        return footer
-
-    def generate_observations_html(self):
-        obs_text = ""
-        if not self.show_n:
-            return obs_text
-        obs_text += '<tr><td style="text-align: left">Observations</td>'
-        if len(self.first_table_col.columns) > 1:
-            obs_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
+        if layout.num_label_columns > 1:
+            stat_text += (
+                '<td colspan="' + str(layout.num_label_columns - 1) + '">' + "</td>"
             )
-        for md in self.model_data:
-            if np.isnan(md["n_obs"]):
-                obs_text += "<td>  </td>"
+        for j, value in enumerate(row.values):
+            if value == "":
+                stat_text += "<td>" + HTML_EMPTY_STAT_CELLS[row.stat] + "</td>"
             else:
-                obs_text += "<td>" + str(md["n_obs"]) + "</td>"
-
-        obs_text += "</tr>"
-        return obs_text
-
-    def generate_r2_html(self):
-        r2_text = ""
-        if not self.show_r2:
-            return r2_text
-        r2_text += '<tr><td style="text-align: left">R<sup>2</sup></td>'
-        if len(self.first_table_col.columns) > 1:
-            r2_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
-            )
-        for md in self.model_data:
-            if np.isnan(md["r2"]):
-                r2_text += "<td> </td>"
-            else:
-                r2_text += "<td>" + str(np.round(md["r2"], self.sig_digits)) + "</td>"
-        r2_text += "</tr>"
-        return r2_text
-
-    def generate_r2_adj_html(self):
-        r2_text = ""
-        if not self.show_r2:
-            return r2_text
-        r2_text += '<tr><td style="text-align: left">Adjusted R<sup>2</sup></td>'
-        if len(self.first_table_col.columns) > 1:
-            r2_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
-            )
-        for md in self.model_data:
-            if np.isnan(md["r2_adj"]):
-                r2_text += "<td>  </td>"
-            else:
-                r2_text += "<td>" + str(np.round(md["r2_adj"], self.sig_digits)) + "</td>"
-        r2_text += "</tr>"
-        return r2_text
-
-    def generate_resid_std_err_html(self):
-        rse_text = ""
-        if not self.show_r2:
-            return rse_text
-        rse_text += '<tr><td style="text-align: left">Residual Std. Error</td>'
-        if len(self.first_table_col.columns) > 1:
-            rse_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
-            )
-        for md in self.model_data:
-            if np.isnan(md["resid_std_err"]):
-                rse_text += "<td> "
-            else:
-                rse_text += "<td>" + str(np.round(md["resid_std_err"], self.sig_digits))
-                if self.show_dof and not np.isnan(md["degree_freedom_resid"]):
-                    rse_text += "(df = " + str(np.round(md["degree_freedom_resid"])) + ")"
-            rse_text += "</td>"
-        rse_text += "</tr>"
-        return rse_text
-
-    def generate_f_statistic_html(self):
-        f_text = ""
-        if not self.show_r2:
-            return f_text
-        f_text += '<tr><td style="text-align: left">F Statistic</td>'
-        if len(self.first_table_col.columns) > 1:
-            f_text += (
-                '<td colspan="'
-                + str(len(self.first_table_col.columns) - 1)
-                + '">'
-                + "</td>"
-            )
-        for md in self.model_data:
-            if np.isnan(md["f_statistic"]):
-                f_text += "<td>"
-            else:
-                f_text += "<td>" + str(np.round(md["f_statistic"], self.sig_digits))
-                f_text += "<sup>" + md["sig_icon_fstat"] + "</sup>"
-                if self.show_dof:
-                    ind_df = np.isnan(md["degree_freedom"])
-                    ind_dfr = np.isnan(md["degree_freedom_resid"])
-                    ind = min(ind_df, ind_dfr)
-                    f_text += (1 - ind) * (
-                        "(df = "
-                        + (1 - ind_df) * str(md["degree_freedom"])
-                        + "; "
-                        + (1 - ind_dfr) * str(md["degree_freedom_resid"])
-                        + ")"
-                    )
-            f_text += "</td>"
-        f_text += "</tr>"
-        return f_text
-
-    def generate_notes_html(self):
+                stat_text += "<td>" + value
+                if row.stars is not None:
+                    stat_text += "<sup>" + row.stars[j] + "</sup>"
+                stat_text += row.suffixes[j] + "</td>"
+        stat_text += "</tr>"
+        return stat_text
+
+    def generate_notes_html(self, layout=None):
+        if layout is None:
+            layout = self.table_layout()
+        notes = layout.notes
         notes_text = ""
-        if not self.show_notes:
+        if notes is None:
             return notes_text
-
-        notes_text += '<tr><td style="text-align: left">' + self.notes_label + "</td>"
-
-        if self.notes_append:
-            notes_text += self.generate_p_value_section_html()
+        num_columns = layout.num_models + layout.num_label_columns
+
+        notes_text += '<tr><td style="text-align: left">' + notes.label + "</td>"
+
+        if notes.sig_levels is not None:
+            sig_levels = notes.sig_levels
+            notes_text += """
+ <td colspan="{}" style="text-align: right">""".format(num_columns - 1)
+            for i in range(len(sig_levels) - 1):
+                notes_text += (
+                    "<sup>"
+                    + "*" * (len(sig_levels) - i)
+                    + """</sup>p&lt;{}; """.format(sig_levels[i])
+                )
+            notes_text += """<sup>*</sup>p&lt;{} </td>""".format(sig_levels[-1])
 
         notes_text += "</tr>"
 
-        notes_text += self.generate_additional_notes_html()
-
-        return notes_text
-
-    def generate_p_value_section_html(self):
-        sig_levels = sorted(self.sig_levels)
-        notes_text = """
- <td colspan="{}" style="text-align: right">""".format(
-            self.num_models + len(self.first_table_col.columns) - 1
-        )
-        for i in range(len(sig_levels) - 1):
-            notes_text += (
-                "<sup>"
-                + "*" * (len(sig_levels) - i)
-                + """</sup>p&lt;{}; """.format(sig_levels[i])
-            )
-        notes_text += """<sup>*</sup>p&lt;{} </td>""".format(sig_levels[-1])
-        return notes_text
-
-    def generate_additional_notes_html(self):
-        notes_text = ""
-        if len(self.custom_notes) == 0:
-            return notes_text
-        for i, note in enumerate(self.custom_notes):
-            if (i != 0) or (self.notes_append):
+        for i, note in enumerate(notes.custom):
+            if (i != 0) or (notes.sig_levels is not None):
                 notes_text += "<tr>"
             notes_text += (
                 '<td></td><td colspan="'
-                + str(self.num_models + len(self.first_table_col.columns) - 1)
+                + str(num_columns - 1)
                 + '" style="text-align: right">'
                 + note
                 + "</td></tr>"
@@ -701,317 +1586,269 @@ class Stargazer:
         return notes_text
 
     # Begin LaTeX render functions
-    def render_latex(self, only_tabular=False):
-        latex = ""
-        latex += self.generate_header_latex(only_tabular=only_tabular)
-        latex += self.generate_body_latex()
-        latex += self.generate_footer_latex(only_tabular=only_tabular)
+    def render_latex(self, only_tabular=False, stream=None):
+        """
+        Render the table in LaTeX.
 
-        return latex
+        If stream is given, the table is written chunk by chunk to this
+        file-like object instead of being returned as a string.
+        """
+        chunks = self.iter_latex(only_tabular=only_tabular, cache_body=stream is None)
+        return _join_or_write(chunks, stream)
+
+    async def render_latex_async(
+        self, only_tabular=False, chunk_size=100, executor=None
+    ):
+        """
+        Render the table in LaTeX without blocking the event loop. The
+        table is rendered in executor, see aiter_latex.
+        """
+        chunks = self.aiter_latex(only_tabular, chunk_size, executor, cache_body=True)
+        return "".join([chunk async for chunk in chunks])
+
+    def aiter_latex(
+        self, only_tabular=False, chunk_size=100, executor=None, cache_body=False
+    ):
+        """
+        Asynchronously iterate over the pieces of iter_latex. Every piece
+        is rendered in executor (a thread pool; None uses the default
+        executor of the event loop) and cancelling the task iterating
+        stops the rendering after the current piece. The first piece
+        also builds the layout of the table, unless it is cached.
+        """
+        chunks = self.iter_latex(only_tabular, chunk_size, cache_body)
+        return _iter_in_executor(chunks, executor)
+
+    def iter_latex(self, only_tabular=False, chunk_size=100, cache_body=False):
+        """
+        Yield the LaTeX table in pieces: the header, the body in
+        chunks of chunk_size parameters, the footer and the notes.
+
+        The header, footer and notes are cached and only rendered again
+        when an option they depend on changes. By default the body is
+        formatted and rendered chunk by chunk on every call and not kept,
+        so that streaming a large table only holds one chunk at a time.
+        With cache_body, its formatted cells (see table_layout) and its
+        rendered chunks are cached as well.
+        """
+        return self.iter_fragments(
+            "latex",
+            lambda layout: [
+                (
+                    "header",
+                    ("latex", "header", only_tabular),
+                    ["header"],
+                    lambda: [self.generate_header_latex(only_tabular, layout)],
+                ),
+                (
+                    "body",
+                    ("latex", "body", chunk_size) if layout.cache_body else None,
+                    ["body", "cells"],
+                    partial(self.iter_body_latex, chunk_size, layout),
+                ),
+                (
+                    "footer",
+                    ("latex", "footer"),
+                    ["footer"],
+                    lambda: [self.generate_summary_latex(layout)],
+                ),
+                (
+                    "notes",
+                    ("latex", "notes", only_tabular),
+                    ["footer", "notes"],
+                    lambda: [self.generate_table_end_latex(only_tabular, layout)],
+                ),
+            ],
+            self.render_options(),
+            cache_body,
+        )
 
-    def generate_header_latex(self, only_tabular=False):
-        ncol = len(self.first_table_col.columns)
+    def generate_header_latex(self, only_tabular=False, layout=None):
+        if layout is None:
+            layout = self.table_layout()
+        ncol = layout.num_label_columns
+        num_models = layout.num_models
         header = ""
         if not only_tabular:
             header += "\\begin{table}[!htbp] \\centering\n"
-            if not self.show_header:
+            if not layout.show_header:
                 return header
 
-            if self.title_text is not None:
-                header += "  \\caption{" + self.title_text + "}\n"
+            if layout.title is not None:
+                header += "  \\caption{" + layout.title + "}\n"
 
             header += "  \\label{}\n"
 
         header += (
-            "\\begin{tabularx}{\\textwidth}{"
-            + ncol * "l"
-            + self.num_models * "X"
-            + "}\n"
+            "\\begin{tabularx}{\\textwidth}{" + ncol * "l" + num_models * "X" + "}\n"
         )
         header += "\\\\[-1.8ex]\\hline\n"
         header += "\\hline \\\\[-1.8ex]\n"
-        if self.model_name is not None:
-            header += "&" * ncol + "\\multicolumn{" + str(self.num_models) + "}{c}"
-            header += "{\\textit{" + self.model_name + "}} \\\n"
+        rows = {row.kind: row.cells for row in layout.header}
+        if "model_name" in rows:
+            header += "&" * ncol + "\\multicolumn{" + str(num_models) + "}{c}"
+            header += "{\\textit{" + rows["model_name"][0].text + "}} \\\n"
             header += (
                 "\\cr \\cline{"
-                + str(self.num_models + 1)
+                + str(num_models + 1)
                 + "-"
-                + str(self.num_models + ncol)
+                + str(num_models + ncol)
                 + "}\n"
             )
 
-        if self.column_labels is not None:
-            if type(self.column_labels) == str:
+        if "column_labels" in rows:
+            cells = rows["column_labels"]
+            if cells[0].style == "center":
                 header += (
                     "\\\\[-1.8ex]"
                     + "&" * ncol
                     + "\\multicolumn{"
-                    + str(self.num_models)
+                    + str(cells[0].span)
                     + "}{c}{"
-                    + self.column_labels
+                    + cells[0].text
                     + "} \\\\"
                 )
             else:
                 header += "\\\\[-1.8ex]" + (ncol - 1) * "&"
-                for i, label in enumerate(self.column_labels):
-                    header += "& \\multicolumn{" + str(self.column_separators[i])
-                    header += "}{l}{" + label + "} "
+                for cell in cells:
+                    header += "& \\multicolumn{" + str(cell.span)
+                    header += "}{l}{" + cell.text + "} "
                 header += " \\\\\n"
 
-        if self.show_model_nums:
+        if "model_numbers" in rows:
             header += "\\\\[-1.8ex]" + (ncol - 1) * " &"
-            for num in range(1, self.num_models + 1):
-                header += "& (" + str(num) + ") "
+            for cell in rows["model_numbers"]:
+                header += "& " + cell.text + " "
             header += "\\\\\n"
 
         header += "\\hline \\\\[-1.8ex]\n"
 
         return header
 
-    def generate_body_latex(self):
+    def generate_body_latex(self, layout=None):
         """
         Generate the body of the results where the
         covariate reporting is.
         """
-        body = ""
-        for param_name in self.param_names:
-            body += self.generate_param_rows_latex(param_name)
-            body += "  "
-            for _ in range(self.num_models):
-                body += "& "
-            body += "\\\\\n"
-
-        return body
-
-    def generate_param_rows_latex(self, param_name):
-        param_text = ""
-        param_text += self.generate_param_main_latex(param_name)
-        if self.show_precision:
-            param_text += self.generate_param_precision_latex(param_name)
-        else:
-            param_text += "& "
+        return "".join(self.iter_body_latex(layout=layout))
 
-        return param_text
+    def iter_body_latex(self, chunk_size=100, layout=None):
+        if layout is None:
+            layout = self.table_layout()
+        for rows in row_slices(len(layout.body.positions), chunk_size):
+            yield self.generate_param_rows_latex(layout, rows)
 
-    def generate_param_main_latex(self, param_name):
-        if isinstance(param_name, tuple):
-            param_print_name = param_name[-1]
+    def generate_param_rows_latex(self, layout, rows):
+        """
+        Generate the main and precision rows of the parameters selected
+        by rows (a slice of the table body), each followed by a spacer.
+        """
+        body = self.body_cells(layout, rows)
+        ncol = layout.num_label_columns
+        present = body.present
+        labels = body.labels
+        if ncol == 1:
+            param_text = " " + labels[:, 0] + " "
         else:
-            param_print_name = param_name
-        if self.param_nicer_names is not None:
-            param_print_name = self.param_nicer_names.get(
-                param_print_name, param_print_name
-            )
-
-        if not isinstance(param_name, tuple):
-            param_text = " " + param_print_name + " "
+            param_text = " " + join_columns(labels[:, :-1] + "&") + labels[:, -1]
+        main = "& " + body.values
+        if body.stars is not None:
+            main = main + "$^{" + body.stars + "}$"
+        main = np.where(present, main + " ", "& ")
+        param_text = param_text + join_columns(main) + "\\\\\n"
+        if body.precision is not None:
+            precision = np.where(present, "&(" + body.precision + ")", "& ")
+            param_text = param_text + "&" * (ncol - 1) + join_columns(precision)
+            param_text = param_text + "\\\\\n"
         else:
-            param_text = " "
-            for i in range(len(param_name) - 1):
-                param_text += str(self.first_table_col.loc[param_name][i]) + "&"
-            param_text += param_print_name
-        for md in self.model_data:
-            if param_name in list(md["param_names"]):
-                param_text += "& " + str(
-                    np.round(md["param_values"][param_name], self.sig_digits)
-                )
-                if self.show_sig:
-                    param_text += "$^{" + str(md["sig_icons"][param_name]) + "}$"
-                param_text += " "
-            else:
-                param_text += "& "
-        param_text += "\\\\\n"
-
-        return param_text
-
-    def generate_param_precision_latex(self, param_name):
-        param_text = "&" * (len(self.first_table_col.columns) - 1)
-        for md in self.model_data:
-            if param_name in list(md["param_names"]):
-                param_text += "&("
-                if self.confidence_intervals:
-                    param_text += (
-                        str(np.round(md["ci_lower"][param_name], self.sig_digits)) + " , "
-                    )
-                    param_text += str(
-                        np.round(md["ci_upper"][param_name], self.sig_digits)
-                    )
-                else:
-                    param_text += str(
-                        np.round(md["param_std_err"][param_name], self.sig_digits)
-                    )
-                param_text += ")"
-            else:
-                param_text += "& "
-        param_text += "\\\\\n"
+            param_text = param_text + "& "
+        spacer = "  " + "& " * layout.num_models + "\\\\\n"
 
-        return param_text
+        return "".join(param_text + spacer)
 
-    def generate_footer_latex(self, only_tabular=False):
+    def generate_footer_latex(self, only_tabular=False, layout=None):
         """
         Generate the footer of the table where
         model summary section is.
         """
+        if layout is None:
+            layout = self.table_layout()
+        return self.generate_summary_latex(layout) + self.generate_table_end_latex(
+            only_tabular, layout
+        )
 
-        footer = "\\hline \\\\[-1.8ex]\n"
-
-        if not self.show_footer:
-            return footer
-        footer += self.generate_observations_latex()
-        footer += self.generate_r2_latex()
-        footer += self.generate_r2_adj_latex()
-        if self.show_residual_std_err:
-            footer += self.generate_resid_std_err_latex()
-        if self.show_f_statistic:
-            footer += self.generate_f_statistic_latex()
-        footer += "\\hline\n\\hline \\\\[-1.8ex]\n"
-        footer += self.generate_notes_latex()
-        footer += "\\end{tabularx}"
-
+    def generate_summary_latex(self, layout):
+        """
+        Generate the model summary rows of the footer between its rules.
+        """
+        summary = "\\hline \\\\[-1.8ex]\n"
+        if layout.footer is None:
+            return summary
+        for row in layout.footer:
+            summary += self.generate_stat_row_latex(layout, row)
+        return summary + "\\hline\n\\hline \\\\[-1.8ex]\n"
+
+    def generate_table_end_latex(self, only_tabular, layout):
+        """
+        Generate the notes and close the table, unless the footer is hidden.
+        """
+        if layout.footer is None:
+            return ""
+        end = self.generate_notes_latex(layout) + "\\end{tabularx}"
         if not only_tabular:
-            footer += "\n\\end{table}"
-
-        return footer
-
-    def generate_observations_latex(self):
-        obs_text = ""
-        if not self.show_n:
-            return obs_text
-        obs_text += " Observations\\quad\\quad " + "&" * (
-            len(self.first_table_col.columns) - 1
-        )
-        for md in self.model_data:
-            if np.isnan(md["n_obs"]):
-                obs_text += "&   "
-            else:
-                obs_text += "& " + str(md["n_obs"]) + " "
-        obs_text += "\\\\\n"
-        return obs_text
-
-    def generate_r2_latex(self):
-        r2_text = ""
-        if not self.show_r2:
-            return r2_text
-        r2_text += " R${2}$\\quad\\quad " + "&" * (
-            len(self.first_table_col.columns) - 1
-        )
-        for md in self.model_data:
-            if np.isnan(md["r2"]):
-                r2_text += "&   "
-            else:
-                r2_text += "& " + str(np.round(md["r2"], self.sig_digits)) + " "
-        r2_text += "\\\\\n"
-        return r2_text
-
-    def generate_r2_adj_latex(self):
-        r2_text = ""
-        if not self.show_r2:
-            return r2_text
-        r2_text += " Adjusted R${2}$\\quad\\quad" + "&" * (
-            len(self.first_table_col.columns) - 1
-        )
-        for md in self.model_data:
-            if np.isnan(md["r2_adj"]):
-                r2_text += "&   "
-            else:
-                r2_text += "& " + str(np.round(md["r2_adj"], self.sig_digits)) + " "
-        r2_text += "\\\\\n"
-        return r2_text
-
-    def generate_resid_std_err_latex(self):
-        rse_text = ""
-        if not self.show_r2:
-            return rse_text
-        rse_text += " Residual Std. Error \\quad\\quad" + "&" * (
-            len(self.first_table_col.columns) - 1
-        )
-        for md in self.model_data:
-            if np.isnan(md["resid_std_err"]):
-                rse_text += "&  "
-            else:
-                rse_text += "& " + str(np.round(md["resid_std_err"], self.sig_digits))
-                if self.show_dof and not np.isnan(md["degree_freedom_resid"]):
-                    rse_text += "(df = " + str(np.round(md["degree_freedom_resid"])) + ")"
-            rse_text += " "
-        rse_text += " \\\\\n"
-        return rse_text
-
-    def generate_f_statistic_latex(self):
-        f_text = ""
-        if not self.show_r2:
-            return f_text
-
-        f_text += " F Statistic\\quad\\quad " + "&" * (
-            len(self.first_table_col.columns) - 1
-        )
+            end += "\n\\end{table}"
+        return end
 
-        for md in self.model_data:
-            if np.isnan(md["f_statistic"]):
-                f_text += "&    "
+    def generate_stat_row_latex(self, layout, row):
+        """
+        Generate the row of a model summary statistic from a StatRow.
+        """
+        stat_text = LATEX_STAT_LABELS[row.stat] + "&" * (layout.num_label_columns - 1)
+        for j, value in enumerate(row.values):
+            if value == "":
+                stat_text += LATEX_EMPTY_STAT_CELLS[row.stat]
             else:
-                f_text += "& " + str(np.round(md["f_statistic"], self.sig_digits))
-                f_text += "$^{" + md["sig_icon_fstat"] + "}$ "
-                if self.show_dof:
-                    ind_df = np.isnan(md["degree_freedom"])
-                    ind_dfr = np.isnan(md["degree_freedom_resid"])
-                    ind = min(ind_df, ind_dfr)
-                    f_text += (1 - ind) * (
-                        "(df = "
-                        + (1 - ind_df) * str(md["degree_freedom"])
-                        + "; "
-                        + (1 - ind_dfr) * str(md["degree_freedom_resid"])
-                        + ")"
-                    )
-            f_text += " "
-        f_text += "\\\\\n"
-        return f_text
-
-    def generate_notes_latex(self):
+                stat_text += "& " + value
+                if row.stars is not None:
+                    stat_text += "$^{" + row.stars[j] + "}$ "
+                stat_text += row.suffixes[j] + " "
+        if row.stat == "resid_std_err":
+            stat_text += " "
+        stat_text += "\\\\\n"
+        return stat_text
+
+    def generate_notes_latex(self, layout=None):
+        if layout is None:
+            layout = self.table_layout()
+        notes = layout.notes
         notes_text = ""
-        if not self.show_notes:
+        if notes is None:
             return notes_text
 
-        notes_text += "\\textit{" + self.notes_label + "}"
-
-        if self.notes_append:
-            notes_text += self.generate_p_value_section_latex()
-        notes_text += self.generate_additional_notes_latex()
+        notes_text += "\\textit{" + notes.label + "}"
 
-        return notes_text
-
-    def generate_p_value_section_latex(self):
-        sig_levels = sorted(self.sig_levels)
-        notes_text = ""
-        notes_text += (
-            " & \\multicolumn{"
-            + str(self.num_models + len(self.first_table_col.columns) - 1)
-            + "}{r}{"
-        )
-        for i in range(len(sig_levels) - 1):
+        if notes.sig_levels is not None:
+            sig_levels = notes.sig_levels
             notes_text += (
-                "$^{"
-                + "*" * (len(sig_levels) - i)
-                + "}$p$<$"
-                + str(sig_levels[i])
-                + "; "
+                " & \\multicolumn{"
+                + str(layout.num_models + layout.num_label_columns - 1)
+                + "}{r}{"
             )
-        notes_text += "$^{*}$p$<$" + str(sig_levels[-1]) + "} \\\\\n"
-        return notes_text
+            for i in range(len(sig_levels) - 1):
+                notes_text += (
+                    "$^{"
+                    + "*" * (len(sig_levels) - i)
+                    + "}$p$<$"
+                    + str(sig_levels[i])
+                    + "; "
+                )
+            notes_text += "$^{*}$p$<$" + str(sig_levels[-1]) + "} \\\\\n"
 
-    def generate_additional_notes_latex(self):
-        notes_text = ""
-        # if len(self.custom_notes) == 0:
-        #     return notes_text
-        for note in self.custom_notes:
-            # if (i != 0) | (self.notes_append):
-            #     notes_text += '\\multicolumn{' + str(self.num_models) + '}{r}\\textit{' + note + '} \\\\\n'
-            # else:
-            #     notes_text += ' & \\multicolumn{' + str(self.num_models) + '}{r}\\textit{' + note + '} \\\\\n'
+        for note in notes.custom:
             notes_text += (
-                " &" * (len(self.first_table_col.columns))
+                " &" * layout.num_label_columns
                 + "\\multicolumn{"
-                + str(self.num_models)
+                + str(layout.num_models)
                 + "}{r}\\textit{"
                 + note
                 + "} \\\\\n"
@@ -1019,10 +1856,268 @@ class Stargazer:
 
         return notes_text
 
+    # Begin plain text helpers shared by the Markdown and ASCII renderers
+    def text_header_rows(self, layout, model_name_format="{}"):
+        """
+        Return the header cells of a plain text table: the model numbers
+        followed by rows with the model name and column labels. Labels
+        spanning several models are put in the first of their columns.
+        """
+        blank = [""] * layout.num_label_columns
+        rows = {
+            row.kind: expand_cells(row.cells, model_name_format)
+            for row in layout.header
+        }
+        text_rows = [blank + rows.get("model_numbers", [""] * layout.num_models)]
+        if not layout.show_header:
+            return text_rows
+        for kind in ["model_name", "column_labels"]:
+            if kind in rows:
+                text_rows.append(blank + rows[kind])
+        return text_rows
+
+    def text_body_rows(self, layout, rows, star="*", label_escape=None, models=None):
+        """
+        Arrange the labels and formatted cells of the parameters selected
+        by rows (a slice of the table body) into a string array with one
+        main row and, if the precision is shown, one precision row per
+        parameter. The cells are those of all models or, if given, of the
+        positions in models.
+
+        Every significance star is written as star, and label_escape is
+        an optional function applied to every label.
+        """
+        body = self.body_cells(layout, rows, models)
+        present = body.present
+        main = body.values
+        if body.stars is not None:
+            n_stars = np.char.str_len(body.stars.astype(str))
+            main = main + np.char.multiply(star, n_stars).astype(object)
+        main = np.where(present, main, "")
+        labels = body.labels
+        if label_escape is not None:
+            labels = np.vectorize(label_escape, otypes=[object])(labels)
+        text_rows = np.concatenate([labels, main], axis=1).astype(str)
+        if body.precision is not None:
+            precision = np.where(present, "(" + body.precision + ")", "")
+            blank = np.full(labels.shape, "", dtype=object)
+            precision_rows = np.concatenate([blank, precision], axis=1).astype(str)
+            text_rows = np.stack([text_rows, precision_rows], axis=1).reshape(
+                -1, text_rows.shape[1]
+            )
+        return text_rows
+
+    def text_footer_rows(self, layout, stat_labels, star="*"):
+        """
+        Return the cells of the model summary statistics, labelled with
+        the names in the stat_labels dictionary.
+        """
+        rows = []
+        if layout.footer is None:
+            return rows
+        for row in layout.footer:
+            cells = []
+            for j, value in enumerate(row.values):
+                if value and row.stars is not None:
+                    value += star * len(row.stars[j])
+                cells.append(value + row.suffixes[j])
+            blank = [""] * (layout.num_label_columns - 1)
+            rows.append([stat_labels[row.stat]] + blank + cells)
+        return rows
+
+    def text_column_widths(
+        self, layout, header_rows, footer_rows, chunk_size=100, **kwargs
+    ):
+        """
+        Compute the width of every column as the length of its longest
+        cell. The body is arranged chunk by chunk, so that the widths of
+        large tables are found without holding all cells. Keyword
+        arguments are passed to text_body_rows.
+        """
+        widths = np.char.str_len(np.array(header_rows, dtype=str)).max(axis=0)
+        for rows in row_slices(len(layout.body.positions), chunk_size):
+            text_rows = self.text_body_rows(layout, rows, **kwargs)
+            widths = np.maximum(widths, np.char.str_len(text_rows).max(axis=0))
+        if footer_rows:
+            footer_rows = np.array(footer_rows, dtype=str)
+            widths = np.maximum(widths, np.char.str_len(footer_rows).max(axis=0))
+        return widths
+
+    def text_notes(self, layout, star="*"):
+        """
+        Return the note label, the significance legend (if appended) and
+        the custom notes as lines of plain text.
+        """
+        notes = layout.notes
+        if notes is None:
+            return []
+        first_line = notes.label
+        if notes.sig_levels is not None:
+            first_line += " " + "; ".join(
+                star * (len(notes.sig_levels) - i) + "p<" + str(level)
+                for i, level in enumerate(notes.sig_levels)
+            )
+        return [first_line] + notes.custom
+
     # Begin Markdown render functions
-    # def render_markdown(self):
-    #     print("sorry haven't made this yet :/")
+    def render_markdown(self, stream=None):
+        """
+        Render the table as a GitHub flavored Markdown pipe table.
+
+        If stream is given, the table is written chunk by chunk to this
+        file-like object instead of being returned as a string.
+        """
+        return _join_or_write(self.iter_markdown(cache_body=stream is None), stream)
+
+    def iter_markdown(self, chunk_size=100, cache_body=False):
+        """
+        Yield the Markdown table in pieces: the header, the body in
+        chunks of chunk_size parameters and the footer. With cache_body,
+        the formatted cells of the body are cached, see table_layout.
+        """
+        layout = self.table_layout(cache_body=cache_body)
+        header_rows = self.text_header_rows(layout, model_name_format="*{}*")
+        footer_rows = self.text_footer_rows(layout, MARKDOWN_STAT_LABELS, star="\\*")
+        widths = self.text_column_widths(
+            layout,
+            header_rows,
+            footer_rows,
+            chunk_size,
+            star="\\*",
+            label_escape=_escape_markdown_label,
+        )
+        # the delimiter row needs at least three characters per column
+        widths = np.maximum(widths, 3)
+        yield self.generate_header_markdown(layout, header_rows, widths)
+        yield from self.iter_body_markdown(layout, widths, chunk_size)
+        yield self.generate_footer_markdown(layout, footer_rows, widths)
+
+    def generate_header_markdown(self, layout, header_rows, widths):
+        ncol = layout.num_label_columns
+        header = ""
+        if layout.show_header and layout.title is not None:
+            header += "**" + layout.title + "**\n\n"
+        header += _markdown_row(header_rows[0], widths)
+        rule = [":" + "-" * (w - 1) for w in widths[:ncol]]
+        rule += [":" + "-" * (w - 2) + ":" for w in widths[ncol:]]
+        header += "| " + " | ".join(rule) + " |\n"
+        for row in header_rows[1:]:
+            header += _markdown_row(row, widths)
+        return header
+
+    def iter_body_markdown(self, layout, widths, chunk_size=100):
+        for rows in row_slices(len(layout.body.positions), chunk_size):
+            text_rows = self.text_body_rows(
+                layout, rows, star="\\*", label_escape=_escape_markdown_label
+            )
+            padded = [np.char.ljust(text_rows[:, i], w) for i, w in enumerate(widths)]
+            text_rows = np.stack(padded, axis=1)
+            yield "".join("| " + " | ".join(row) + " |\n" for row in text_rows)
+
+    def generate_footer_markdown(self, layout, footer_rows, widths):
+        footer = ""
+        for row in footer_rows:
+            footer += _markdown_row(row, widths)
+        for line in self.text_notes(layout, star="\\*"):
+            footer += "\n" + line + "\n"
+        return footer
 
     # Begin ASCII render functions
-    # def render_ascii(self):
-    #     print("sorry haven't made this yet :/")
+    def render_ascii(self, max_width=None, stream=None):
+        """
+        Render the table as fixed-width plain text for terminals and logs.
+
+        If max_width is given, the model columns are wrapped into several
+        blocks that are at most max_width characters wide, each repeating
+        the parameter labels. If stream is given, the table is written
+        chunk by chunk to this file-like object instead of being returned
+        as a string.
+        """
+        chunks = self.iter_ascii(max_width=max_width, cache_body=stream is None)
+        return _join_or_write(chunks, stream)
+
+    def iter_ascii(self, max_width=None, chunk_size=100, cache_body=False):
+        """
+        Yield the ASCII table in pieces: for every block of models the
+        header, the body in chunks of chunk_size parameters and the footer.
+        With cache_body, the formatted cells of the body are cached, see
+        table_layout.
+        """
+        layout = self.table_layout(cache_body=cache_body)
+        ncol = layout.num_label_columns
+        header_rows = self.text_header_rows(layout)
+        footer_rows = self.text_footer_rows(layout, ASCII_STAT_LABELS)
+        widths = self.text_column_widths(layout, header_rows, footer_rows, chunk_size)
+        blocks = self.ascii_column_blocks(layout, widths, max_width)
+        if layout.show_header and layout.title is not None:
+            yield layout.title + "\n"
+        for k, block in enumerate(blocks):
+            columns = list(range(ncol)) + [ncol + j for j in block]
+            if k > 0:
+                yield "\n"
+            yield self.generate_header_ascii(layout, header_rows, widths, columns)
+            yield from self.iter_body_ascii(layout, widths, columns, chunk_size)
+            yield self.generate_footer_ascii(layout, footer_rows, widths, columns)
+        yield "".join(line + "\n" for line in self.text_notes(layout))
+
+    def ascii_column_blocks(self, layout, widths, max_width=None):
+        """
+        Split the models into blocks of consecutive models whose columns,
+        together with the label columns, fit into max_width characters.
+        Every block contains at least one model.
+        """
+        ncol = layout.num_label_columns
+        models = list(range(layout.num_models))
+        if max_width is None:
+            return [models]
+        label_width = sum(widths[:ncol]) + len(ASCII_SEPARATOR) * (ncol - 1)
+        blocks = [[]]
+        block_width = label_width
+        for j in models:
+            width = len(ASCII_SEPARATOR) + widths[ncol + j]
+            if blocks[-1] and block_width + width > max_width:
+                blocks.append([])
+                block_width = label_width
+            blocks[-1].append(j)
+            block_width += width
+        return blocks
+
+    def generate_header_ascii(self, layout, header_rows, widths, columns):
+        ncol = layout.num_label_columns
+        rule_width = _ascii_table_width(widths[columns])
+        header = "=" * rule_width + "\n"
+        for row in header_rows[1:] + header_rows[:1]:
+            if any(row[c] for c in columns):
+                header += _ascii_row([row[c] for c in columns], widths[columns], ncol)
+        header += "-" * rule_width + "\n"
+        return header
+
+    def iter_body_ascii(self, layout, widths, columns, chunk_size=100):
+        ncol = layout.num_label_columns
+        # only the cells of the models of the block are formatted
+        models = [c - ncol for c in columns[ncol:]]
+        for rows in row_slices(len(layout.body.positions), chunk_size):
+            text_rows = self.text_body_rows(layout, rows, models=models)
+            # precision rows of parameters missing in all models of a block
+            text_rows = text_rows[np.char.str_len(text_rows).sum(axis=1) > 0]
+            padded = [
+                (
+                    np.char.ljust(text_rows[:, i], widths[c])
+                    if i < ncol
+                    else np.char.center(text_rows[:, i], widths[c])
+                )
+                for i, c in enumerate(columns)
+            ]
+            text_rows = np.stack(padded, axis=1)
+            yield "".join(
+                ASCII_SEPARATOR.join(row).rstrip() + "\n" for row in text_rows
+            )
+
+    def generate_footer_ascii(self, layout, footer_rows, widths, columns):
+        ncol = layout.num_label_columns
+        rule_width = _ascii_table_width(widths[columns])
+        footer = "-" * rule_width + "\n"
+        for row in footer_rows:
+            footer += _ascii_row([row[c] for c in columns], widths[columns], ncol)
+        footer += "=" * rule_width + "\n"
+        return footer
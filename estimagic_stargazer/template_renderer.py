@@ -0,0 +1,147 @@
+"""
+Template based rendering of Stargazer tables.
+
+The tables are rendered with Jinja2 templates from the ``templates`` directory.
+The templates are compiled once per process and their bytecode is cached on
+disk, and all numbers are formatted before the template is rendered, so that
+templates only arrange precomputed cells. Users can restyle the output by
+passing their own template directory.
+
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import jinja2
+
+from .layout import row_slices
+from .stargazer_function import HTML_STAT_LABELS
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+@lru_cache(maxsize=None)
+def get_environment(template_dir=None):
+    """Create the Jinja2 environment for a template directory.
+
+    The environment is created only once per directory and uses a bytecode cache
+    in the temporary directory of the system, so that templates are compiled at
+    most once.
+
+    Args:
+        template_dir (str or pathlib.Path): directory with the templates. Default
+            is the ``templates`` directory of this package.
+
+    Returns:
+        jinja2.Environment
+    """
+    template_dir = TEMPLATE_DIR if template_dir is None else template_dir
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(template_dir)),
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # the text options of Stargazer may contain html, as in render_html
+        autoescape=False,
+    )
+
+
+def render_template(stargazer, template_name="stargazer.html", template_dir=None):
+    """Render a Stargazer table with a Jinja2 template.
+
+    Args:
+        stargazer (Stargazer): the table to render.
+        template_name (str): name of the template file.
+        template_dir (str or pathlib.Path): directory with the templates. Default
+            is the ``templates`` directory of this package.
+
+    Returns:
+        str: the rendered table.
+    """
+    template = get_environment(template_dir).get_template(template_name)
+    return template.render(table_context(stargazer))
+
+
+def table_context(stargazer):
+    """Collect the formatted cells and options of a table for a template.
+
+    Args:
+        stargazer (Stargazer): the table to render.
+
+    Returns:
+        dict: template variables. ``rows`` contains one dict per parameter with
+            the labels of the first columns and one cell per model, which is None
+            if the model does not have the parameter.
+    """
+    options = stargazer.render_options()
+    layout = stargazer.table_layout(options, cache_body=True)
+    rows = []
+    # the cells are formatted in the same slices as by the other renderers,
+    # so that they share the cached cells
+    for row_slice in row_slices(len(layout.body.positions), 100):
+        body = stargazer.body_cells(layout, row_slice)
+        rows += [_row_context(body, i) for i in range(len(body.present))]
+
+    if options.column_labels is None or isinstance(options.column_labels, str):
+        column_labels = options.column_labels
+    else:
+        column_labels = list(zip(options.column_labels, options.column_separators))
+
+    notes = layout.notes
+    return {
+        "title": layout.title,
+        "show_header": layout.show_header,
+        "model_name": options.model_name,
+        "column_labels": column_labels,
+        "show_model_numbers": options.show_model_nums,
+        "num_models": layout.num_models,
+        "num_label_columns": layout.num_label_columns,
+        "rows": rows,
+        "show_precision": options.show_precision,
+        "show_footer": layout.footer is not None,
+        "stats": _stats_context(layout.footer or []),
+        "show_notes": notes is not None,
+        "notes_label": options.notes_label,
+        "sig_notes": _sig_notes_context(notes),
+        "custom_notes": options.custom_notes,
+    }
+
+
+def _row_context(body, i):
+    """Collect the labels and cells of row i of a slice of the body."""
+    row_cells = []
+    for j in range(body.present.shape[1]):
+        if body.present[i, j]:
+            row_cells.append(
+                {
+                    "value": body.values[i, j],
+                    "stars": None if body.stars is None else body.stars[i, j],
+                    "precision": (
+                        None if body.precision is None else body.precision[i, j]
+                    ),
+                }
+            )
+        else:
+            row_cells.append(None)
+    return {"labels": list(body.labels[i]), "cells": row_cells}
+
+
+def _stats_context(stat_rows):
+    """Collect the labels and cells of the model summary statistics."""
+    stats = []
+    for row in stat_rows:
+        cells = []
+        for j, value in enumerate(row.values):
+            if value and row.stars is not None:
+                value += "<sup>" + row.stars[j] + "</sup>"
+            cells.append(value + row.suffixes[j])
+        stats.append((HTML_STAT_LABELS[row.stat], cells))
+    return stats
+
+
+def _sig_notes_context(notes):
+    """List the star strings and significance levels for the table notes."""
+    if notes is None or notes.sig_levels is None:
+        return []
+    sig_levels = notes.sig_levels
+    return [("*" * (len(sig_levels) - i), level) for i, level in enumerate(sig_levels)]